@@ -79,6 +79,7 @@ def update_babel(parser: argparse.ArgumentParser=None, args: argparse.Namespace=
     
     keywords = (
         "gettext",
+        "gettext_template",
         "ngettext",
         "pgettext",
         "npgettext",
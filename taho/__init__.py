@@ -22,30 +22,160 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 __version__ = '1.0.0a'
-from .babel import *
-from .babel.babel import _
-from .database import *
-from .enums import *
-from .exceptions import *
-from .forms import *
-from .utils import *
-from .views import *
-from . import abc
-from .base_view import *
-from .bot import *
-from .currency_amount import *
-from .emoji import *
-from .lazy import *
-
-from typing import NamedTuple, Literal
-
-class VersionInfo(NamedTuple):
-    major: int
-    minor: int
-    micro: int
-    releaselevel: Literal["alpha", "beta", "candidate", "final"]
-    serial: int
+import importlib
+
+# Submodules are only imported when they are first accessed
+# (PEP 562), so that importing taho does not load discord.py,
+# tortoise-orm and Babel.
+_LAZY = {
+    "abc": ".abc",
+    "babel": ".babel",
+    "base_view": ".base_view",
+    "bot": ".bot",
+    "currency_amount": ".currency_amount",
+    "database": ".database",
+    "emoji": ".emoji",
+    "enums": ".enums",
+    "exceptions": ".exceptions",
+    "forms": ".forms",
+    "lazy": ".lazy",
+    "utils": ".utils",
+    "views": ".views",
+}
+
+# The public names exported by the package, with the submodule
+# that owns each of them. Accessing a name only imports its own
+# submodule. It must be kept in sync with the submodules' exports.
+_EXPORTS = {
+    ".babel": (
+        "Babel", "Domain", "LazyString",
+        "discord_translator_gettext", "get_domain", "get_info_text",
+        "gettext", "gettext_template", "info_text", "lazy_gettext",
+        "lazy_ngettext", "lazy_pgettext", "ngettext", "npgettext",
+        "parse_discord_locale", "pgettext", "speaklater",
+    ),
+    ".database": (
+        "AccessRuleShortcut", "Bank", "BankAccount", "BankInfo",
+        "BankingTransaction", "BaseModel", "Class", "ClassStat",
+        "Cluster", "ClusterInfo", "Craft", "CraftAccessRule",
+        "CraftHistory", "CraftReward", "CraftRewardPack", "Hotbar",
+        "Info", "Inventory", "ItemAccessRule", "ItemReward",
+        "ItemRewardPack", "Job", "JobCost", "JobHistory", "JobReward",
+        "NPC", "NPCMessage", "NPCOwner", "NPCRole", "OwnerShortcut",
+        "Role", "Sale", "Server", "ServerChannel", "ServerInfo",
+        "ServerRole", "Sheet", "Shop", "Shortcut", "StuffShortcut",
+        "Trade", "TradePartie", "TradeStuff", "TradeStuffShortcut",
+        "User", "UserPermission", "UserStat", "access_rule", "bank",
+        "base", "class_", "cluster", "convert_to_type", "converter",
+        "create_shortcut", "db_utils", "get", "get_cluster",
+        "get_default_currency", "get_default_user", "get_discord",
+        "get_discord_bulk", "get_discord_guild", "get_discord_member",
+        "get_discord_role", "get_link_field", "get_server",
+        "get_shortcut", "get_stuff", "get_stuff_amount", "get_type",
+        "get_user", "init_db", "inventory", "json", "models",
+        "new_server", "npc", "server", "sheet", "start", "trade",
+        "user", "value_from_json", "value_to_json", "values_from_json",
+    ),
+    ".enums": (
+        "ChannelType", "CraftAccessRuleType", "InfoType", "ItemReason",
+        "ItemType", "ItemUse", "RPEffect", "RegenerationType",
+        "RewardType", "RoleAddedBy", "RoleType", "SalaryCondition",
+        "ShopType", "ShortcutType", "ShortcutableType", "channel",
+        "craft", "get_item_type_text", "get_reward_type_text", "info",
+        "job", "role", "shop", "shortcut",
+    ),
+    ".exceptions": (
+        "AlreadyExists", "BadFormat", "DoesNotExist",
+        "MissingPermissions", "NPCException", "QuantityException",
+        "RoleException", "TahoException", "ValidationException",
+    ),
+    ".forms": (
+        "AccessRule", "Choice", "Currency", "EmojiModal",
+        "EmptyRewardPack", "EmptyRewardPackModal", "Field",
+        "FieldModal", "FieldView", "Form", "FormView", "Infos",
+        "Interaction", "Item", "Modal", "Number", "NumberModal",
+        "Reward", "RewardPack", "Select", "SelectView", "Stat",
+        "Text", "TextInput", "TextModal", "TextStyle", "access",
+        "choice", "currency", "empty_reward_pack", "field", "fields",
+        "forbidden_value", "form", "infos", "is_emoji", "is_int",
+        "is_number", "item", "max_length", "max_value", "min_length",
+        "min_value", "number", "required", "reward", "reward_pack",
+        "select", "stat", "text", "validators",
+    ),
+    ".utils": (
+        "RandomHash", "TahoContext", "TahoTranslator", "before_invoke",
+        "check_perm", "checks", "context", "discord_translator",
+        "get_bot", "get_enum_text", "init_ssh_tunnel",
+        "register_before_invoke", "register_bot", "sequence_match",
+        "sequence_matcher", "split_list", "ssh_tunnel_forwarder",
+        "str_to_number", "utils_",
+    ),
+    ".views": (
+        "ConfirmationView", "confirmation",
+    ),
+    ".base_view": (
+        "BaseView",
+    ),
+    ".bot": (
+        "Bot",
+    ),
+    ".currency_amount": (
+        "CurrencyAmount",
+    ),
+    ".emoji": (
+        "Emoji",
+    ),
+    ".lazy": (
+        "lazy_convert",
+    ),
+    ".babel.babel": (
+        "_",
+    ),
+}
+
+_ATTR_TO_MOD = {
+    name: module_name
+    for module_name, names in _EXPORTS.items()
+    for name in names
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name:
+        module = importlib.import_module(module_name, __name__)
+        globals()[name] = module
+        return module
+
+    try:
+        module_name = _ATTR_TO_MOD[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_ATTR_TO_MOD))
+
+# typing is not imported at runtime, the precise
+# VersionInfo type is only declared for type checkers.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import NamedTuple, Literal
+
+    class VersionInfo(NamedTuple):
+        major: int
+        minor: int
+        micro: int
+        releaselevel: Literal["alpha", "beta", "candidate", "final"]
+        serial: int
+else:
+    from collections import namedtuple
+
+    VersionInfo = namedtuple("VersionInfo", "major minor micro releaselevel serial")
+    del namedtuple
 
 version_info: VersionInfo = VersionInfo(major=1, minor=0, micro=0, releaselevel='alpha', serial=0)
 
-del NamedTuple, Literal, VersionInfo
\ No newline at end of file
+del TYPE_CHECKING, VersionInfo
\ No newline at end of file
@@ -49,7 +49,7 @@ class StuffShortcutable(Shortcutable):
     - :class:`~taho.database.models.Inventory`
     """
 
-class OwnerShortcutable:
+class OwnerShortcutable(Shortcutable):
     """An ABC that brings together all the models that can be pointed 
     by a :class:`~taho.database.models.OwnerShortcut`.
 
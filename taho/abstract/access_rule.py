@@ -23,17 +23,16 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from taho.babel import _
 from taho.database.db_utils import get_link_field
+from taho.database.models import Role
 
 if TYPE_CHECKING:
-    from typing import TypeVar, Dict, Union, Type
+    from typing import TypeVar, Dict, Union, Type, Any, Iterable, List
     from taho.database.models import MODEL, AccessRuleShortcut
     from taho.abc import AccessRuleShortcutable
     from taho.bot import Bot
 
     T = TypeVar("T")
-    U = TypeVar("U")
 
 __all__ = (
     "AbstractAccessRule",
@@ -54,28 +53,91 @@ class AbstractAccessRule:
     access: Optional[:class:`.AccessRuleShortcutable`]
         The entity who have access.
     """
+    __slots__ = (
+        "access",
+        "access_shortcut",
+        "have_access",
+        "_dict",
+        "_display",
+    )
+
     def __init__(
         self,
         have_access: bool = False,
         access: AccessRuleShortcutable = None,
         access_shortcut: AccessRuleShortcut = None,
     ) -> None:
-        if not access and not access_shortcut:
+        if access is None and access_shortcut is None:
             raise ValueError("Either access or access_shortcut must be set.")
+        self._dict = None
+        self._display = None
         self.access = access
         self.access_shortcut = access_shortcut
         self.have_access = have_access
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Changing the access rule invalidates
+        # its cached dictionary and display.
+        if not name.startswith("_"):
+            super().__setattr__("_dict", None)
+            super().__setattr__("_display", None)
+
     def to_dict(self) -> Dict[str, Union[AccessRuleShortcut, AccessRuleShortcutable, bool, None]]:
         """
         Returns a dictionary representation of the access.
+
+        The dictionary is cached until the access rule
+        is modified, so it must not be modified.
         """
-        return {
-            "access": self.access,
-            "access_shortcut": self.access_shortcut,
-            "have_access": self.have_access,
-        }
+        if self._dict is None:
+            self._dict = {
+                "access": self.access,
+                "access_shortcut": self.access_shortcut,
+                "have_access": self.have_access,
+            }
+        return self._dict
     
+    @classmethod
+    async def prefetch_many(cls, rules: Iterable[AbstractAccessRule]) -> None:
+        """|coro|
+
+        Resolves the :attr:`access` of many rules at once,
+        with one query per type of entity instead of one
+        query per rule.
+
+        Call it before displaying a list of rules.
+
+        Parameters
+        -----------
+        rules: Iterable[:class:`.AbstractAccessRule`]
+            The rules to resolve the access of.
+            Rules whose access is already set are skipped.
+            Rules whose entity is not found keep their
+            access unset.
+        """
+        to_fetch: Dict[str, List[AbstractAccessRule]] = {}
+        for rule in rules:
+            if rule.access is None:
+                attr = rule.access_shortcut.converters[rule.access_shortcut.type]
+                to_fetch.setdefault(attr, []).append(rule)
+
+        for attr, attr_rules in to_fetch.items():
+            id_name = attr + "_id"
+            model = attr_rules[0].access_shortcut._meta.fields_map[attr].related_model
+            ids = {getattr(rule.access_shortcut, id_name) for rule in attr_rules}
+            ids.discard(None)
+            accesses = {
+                access.pk: access
+                for access in await model.filter(pk__in=ids)
+            }
+            for rule in attr_rules:
+                access = accesses.get(getattr(rule.access_shortcut, id_name))
+                # The entity may have been deleted, the access
+                # is then left to the shortcut (see get_display).
+                if access is not None:
+                    rule.access = access
+
     async def to_db_access(self, access_type: Type[T], link: MODEL) -> T:
         """|coro|
 
@@ -100,11 +162,9 @@ class AbstractAccessRule:
         
         link_field = get_link_field(access_type)
 
-        self_dict = self.to_dict()
-        self_dict[link_field] = link
-
         return await access_type.create(
-            **self_dict
+            **self.to_dict(),
+            **{link_field: link}
         )
 
     async def get_display(self, bot: Bot = None, guild_id: int = None) -> str:
@@ -112,24 +172,29 @@ class AbstractAccessRule:
 
         Returns the display of the reward.
         """
-        if hasattr(self, "_display"):
+        if self._display is not None:
             return self._display
 
         if not bot:
             from ..utils.utils_ import get_bot
             bot = get_bot()
 
-        from taho.database.models import Role
+        from taho.babel import gettext_template
 
-        access = self.access or await self.access_shortcut.get()
+        # The resolved access is kept, so that the shortcut
+        # is only fetched once.
+        if self.access is None:
+            self.access = await self.access_shortcut.get()
+        access = self.access
 
         if isinstance(access, Role):
             access_str = await access.get_display(bot, server_id=guild_id)
         
         if self.have_access:
-            self._display = _("✅ %(entity)s", entity=access_str)
+            template = gettext_template("✅ %(entity)s")
         else:
-            self._display = _("❌ %(entity)s", entity=access_str)
+            template = gettext_template("❌ %(entity)s")
+        self._display = template % {"entity": access_str}
 
         return self._display 
 
@@ -23,11 +23,10 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from taho.babel import _
 from taho.database.db_utils import get_link_field
 
 if TYPE_CHECKING:
-    from typing import TypeVar, Dict, Union, Type
+    from typing import TypeVar, Dict, Union, Type, Any
     from taho.database.models import MODEL, Stat
 
     T = TypeVar("T")
@@ -52,23 +51,44 @@ class AbstractClassStat:
     access: Optional[:class:`.AccessRuleShortcutable`]
         The entity who have access.
     """
+    __slots__ = (
+        "stat",
+        "value",
+        "_dict",
+        "_display",
+    )
+
     def __init__(
         self,
         stat: Stat,
         value: int = None
     ) -> None:
+        self._dict = None
+        self._display = None
         self.stat = stat
         self.value = value
     
-    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Changing the stat invalidates
+        # its cached dictionary and display.
+        if not name.startswith("_"):
+            super().__setattr__("_dict", None)
+            super().__setattr__("_display", None)
+
     def to_dict(self) -> Dict[str, Union[str, T]]:
         """
         Returns a dictionary representation of the stat.
+
+        The dictionary is cached until the stat
+        is modified, so it must not be modified.
         """
-        return {
-            "stat": self.stat,    
-            "value": self.value
-        }
+        if self._dict is None:
+            self._dict = {
+                "stat": self.stat,    
+                "value": self.value
+            }
+        return self._dict
     
     async def to_db_stat(self, stat_type: Type[U], link: MODEL) -> U:
         """|coro|
@@ -92,12 +112,10 @@ class AbstractClassStat:
             The converted stat.
         """
         link_field = get_link_field(stat_type)
-        
-        self_dict = self.to_dict()
-        self_dict[link_field] = link
 
         return await stat_type.create(
-            **self_dict
+            **self.to_dict(),
+            **{link_field: link}
         )
 
     async def get_display(self) -> str:
@@ -110,14 +128,15 @@ class AbstractClassStat:
         :class:`str`
             The stat's display string.
         """
-        if hasattr(self, "_display"):
+        if self._display is not None:
             return self._display
 
-        self._display = _(
-            "*%(stat_display)s*: **%(value)s**",
-            stat_display=self.stat.get_display(),
-            value=self.value if self.value is not None else _("Unanswered")
-        )
+        from taho.babel import gettext_template
+
+        self._display = gettext_template("*%(stat_display)s*: **%(value)s**") % {
+            "stat_display": self.stat.get_display(),
+            "value": self.value if self.value is not None else gettext_template("Unanswered")
+        }
 
         return self._display 
 
@@ -23,12 +23,11 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from taho.babel import _
 from taho.database.db_utils import value_to_json, get_link_field
-from taho.utils import _get_display
+from taho.utils.utils_ import _get_display
 
 if TYPE_CHECKING:
-    from typing import TypeVar, Dict, Union, Type
+    from typing import TypeVar, Dict, Union, Type, Any
     from taho.database.models import MODEL
 
     T = TypeVar("T")
@@ -53,21 +52,53 @@ class AbstractInfo:
     access: Optional[:class:`.AccessRuleShortcutable`]
         The entity who have access.
     """
+    __slots__ = (
+        "key",
+        "value",
+        "_dict",
+        "_display",
+    )
+
     def __init__(
         self,
         key: str,
         value: T,
     ) -> None:
+        self._dict = None
+        self._display = None
         self.key = key
         self.value = value
     
-    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Changing the info invalidates
+        # its cached dictionary and display.
+        if not name.startswith("_"):
+            super().__setattr__("_dict", None)
+            super().__setattr__("_display", None)
+
     def to_dict(self) -> Dict[str, Union[str, T]]:
         """
         Returns a dictionary representation of the info.
+
+        The dictionary is cached until the info
+        is modified, so it must not be modified.
+        """
+        if self._dict is None:
+            self._dict = {
+                "key": self.key,    
+                "value": self.value
+            }
+        return self._dict
+
+    def to_db_payload(self) -> Dict[str, str]:
+        """
+        Returns the dictionary used to store the info
+        in the DB, with its value serialized by
+        :func:`~taho.database.db_utils.value_to_json`.
         """
         return {
-            "key": self.key,    
+            "key": self.key,
             "value": value_to_json(self.value)
         }
     
@@ -93,12 +124,10 @@ class AbstractInfo:
             The converted info.
         """
         link_field = get_link_field(info_type)
-        
-        self_dict = self.to_dict()
-        self_dict[link_field] = link
 
         return await info_type.create(
-            **self_dict
+            **self.to_db_payload(),
+            **{link_field: link}
         )
 
     async def get_display(self) -> str:
@@ -111,16 +140,15 @@ class AbstractInfo:
         :class:`str`
             The info's display string.
         """
-        if hasattr(self, "_display"):
+        if self._display is not None:
             return self._display
 
-        from taho.babel import get_info_text
+        from taho.babel import gettext_template, get_info_text
 
-        self._display = _(
-            "*%(info_text)s*: **%(value)s**",
-            info_text=await get_info_text(self.key),
-            value=_get_display(self.value)
-        )
+        self._display = gettext_template("*%(info_text)s*: **%(value)s**") % {
+            "info_text": await get_info_text(self.key),
+            "value": _get_display(self.value)
+        }
 
         return self._display 
 
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from taho.enums import RewardType, get_reward_type_text
-from taho.babel import _
+from taho.babel import _, gettext_template
 from taho.database.db_utils import get_link_field
 
 if TYPE_CHECKING:
@@ -220,8 +220,9 @@ class AbstractReward:
         min_amount: float = None,
         max_amount: float = None,
     ) -> None:
-        if not stuff and not stuff_shortcut:
+        if stuff is None and stuff_shortcut is None:
             raise ValueError("Either stuff or stuff_shortcut must be set.")
+        self._display = None
         self.stuff = stuff
         self.stuff_shortcut = stuff_shortcut
         self.regeneration = regeneration
@@ -293,7 +294,7 @@ class AbstractReward:
 
         Returns the display of the reward.
         """
-        if hasattr(self, "_display"):
+        if self._display is not None:
             return self._display
 
         if not bot:
@@ -305,10 +306,9 @@ class AbstractReward:
         stuff = self.stuff or await self.stuff_shortcut.get()
 
         if isinstance(stuff, Role):
-            self._display = _(
-                "**%(role)s**",
-                role=await stuff.get_display(bot, server_id=guild_id)
-            )
+            self._display = gettext_template("**%(role)s**") % {
+                "role": await stuff.get_display(bot, server_id=guild_id)
+            }
         else:
             stuff_name = stuff.get_display()
             if not isinstance(stuff_name, str):
@@ -316,29 +316,31 @@ class AbstractReward:
 
             if isinstance(stuff, Item):
                 if self.durability:
-                    additional_info = _("*(durability)*")
+                    additional_info = gettext_template("*(durability)*")
                 else:
-                    additional_info = _("*(quantity)*")
+                    additional_info = gettext_template("*(quantity)*")
             elif isinstance(stuff, Stat):
                 if self.regeneration:
-                    additional_info = _("*(regeneration)*")
+                    additional_info = gettext_template("*(regeneration)*")
                 else:
-                    additional_info = _("*(maximum)*")
+                    additional_info = gettext_template("*(maximum)*")
 
             if self.min_amount is not None and self.max_amount is not None:
-                self._display = _(
-                    "%(min_amount)s/%(max_amount)s **%(stuff_name)s** %(additional_info)s",
-                    min_amount=self.min_amount,
-                    max_amount=self.max_amount,
-                    stuff_name=stuff_name,
-                    additional_info=additional_info
-                )
+                self._display = gettext_template(
+                    "%(min_amount)s/%(max_amount)s **%(stuff_name)s** %(additional_info)s"
+                ) % {
+                    "min_amount": self.min_amount,
+                    "max_amount": self.max_amount,
+                    "stuff_name": stuff_name,
+                    "additional_info": additional_info
+                }
             elif self.min_amount is not None:
-                self._display = _(
-                    "%(min_amount)s **%(stuff_name)s** %(additional_info)s",
-                    min_amount=self.min_amount,
-                    stuff_name=stuff_name,
-                    additional_info=additional_info
-                )
+                self._display = gettext_template(
+                    "%(min_amount)s **%(stuff_name)s** %(additional_info)s"
+                ) % {
+                    "min_amount": self.min_amount,
+                    "stuff_name": stuff_name,
+                    "additional_info": additional_info
+                }
             
         return self._display
@@ -27,22 +27,29 @@ And the Py18n project:
 https://pypi.org/project/Py18n/
 """
 from __future__ import annotations
+import asyncio
 import contextvars
+from gettext import GNUTranslations, find as find_mo_file
 import os
+import re
+import sys
+from functools import lru_cache, cached_property
 from typing import TYPE_CHECKING
 from babel import support, Locale
 
 from .speaklater import LazyString
 
 if TYPE_CHECKING:
-    from typing import Dict, Tuple, Generator
+    from typing import Dict, Tuple, Generator, List, Optional
     from taho import Bot
 
 __all__ = (
     "Domain",
     "Babel",
     "get_domain",
+    "parse_discord_locale",
     "gettext",
+    "gettext_template",
     "discord_translator_gettext",
     "_",
     "ngettext",
@@ -56,6 +63,131 @@ __all__ = (
 
 domain = "messages"
 
+@lru_cache(maxsize=None)
+def _parse_locale(identifier: str) -> Locale:
+    return Locale.parse(identifier)
+
+@lru_cache(maxsize=None)
+def parse_discord_locale(locale: str) -> Locale:
+    """Returns the :class:`babel.Locale` matching a Discord
+    locale (e.g. ``en-US``).
+
+    The result is cached, so a given Discord locale always
+    gives the same :class:`babel.Locale` instance.
+    """
+    return Locale.parse(locale, sep="-")
+
+class _Placeholder:
+    """Formats as the ``%(name)s`` placeholder of a variable."""
+    __slots__ = ("text",)
+
+    def __init__(self, key: str) -> None:
+        self.text = "%(" + key + ")s"
+
+    def __str__(self) -> str:
+        return self.text
+
+    __repr__ = __str__
+
+    def __format__(self, spec: str) -> str:
+        return self.text
+
+class _SafeDict(dict):
+    """Mapping leaving unknown ``%(name)s`` placeholders as is."""
+    def __missing__(self, key: str) -> _Placeholder:
+        return _Placeholder(key)
+
+# A named ``%`` placeholder (with its flags, width and
+# precision), or an escaped ``%%``.
+_PLACEHOLDER = re.compile(r"%(?:\((\w+)\)([#0 +-]*)(\d*(?:\.\d+)?)([sdifr])|%)")
+
+def _placeholder_to_field(match: re.Match) -> str:
+    name, flags, width, conversion = match.groups()
+    if name is None:
+        return "%"
+    spec = ""
+    if "-" in flags:
+        spec += "<"
+    if "+" in flags:
+        spec += "+"
+    elif " " in flags:
+        spec += " "
+    if "#" in flags:
+        spec += "#"
+    if "0" in flags and "-" not in flags:
+        spec += "0"
+    spec += width
+    if conversion in "sr":
+        # !s and !r, as % calls str() and repr().
+        return "{" + name + "!" + conversion + (":" + spec if spec else "") + "}"
+    return "{" + name + ":" + spec + ("d" if conversion == "i" else conversion) + "}"
+
+@lru_cache(maxsize=4096)
+def _to_format_string(string: str) -> str:
+    """Converts the ``%(name)s`` placeholders of a translated
+    string to the ``{name!s}`` fields of :meth:`str.format_map`.
+
+    The translations are constant, so each one
+    is only converted once.
+    """
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(string):
+        parts.append(string[position:match.start()].replace("{", "{{").replace("}", "}}"))
+        parts.append(_placeholder_to_field(match))
+        position = match.end()
+    parts.append(string[position:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+def _load_catalog(dirname: str, locale: Locale, domain: str) -> Optional[GNUTranslations]:
+    """Parses the ``.mo`` file of the locale in ``dirname``,
+    returns ``None`` if there is none.
+    """
+    filename = find_mo_file(domain, dirname, [str(locale)])
+    if not filename:
+        return None
+    with open(filename, "rb") as fp:
+        return GNUTranslations(fp)
+
+def _intern_catalog(catalog: GNUTranslations) -> None:
+    """Interns the msgids of the catalog, so the source strings
+    are shared between the catalogs of every locale.
+    """
+    catalog._catalog = {
+        (sys.intern(k) if isinstance(k, str)
+        else (sys.intern(k[0]), k[1]) if isinstance(k, tuple)
+        else k): v
+        for k, v in catalog._catalog.items()
+    }
+
+def _flatten_catalog(translations: support.Translations) -> Dict[str, str]:
+    """Builds a plain ``{msgid: msgstr}`` dict from the catalog,
+    giving the same result as ``translations.ugettext`` for
+    non-plural and context-free messages.
+    """
+    catalog = translations._catalog
+    flat = {k: v for k, v in catalog.items() if isinstance(k, str)}
+    singular = translations.plural(1)
+    for key, value in catalog.items():
+        # GNUTranslations falls back to the singular form
+        # of plural messages.
+        if isinstance(key, tuple) and key[1] == singular:
+            flat.setdefault(key[0], value)
+    return flat
+
+def _plural_form(translations: support.Translations, singular: str, plural: str, num: int) -> str:
+    """Same as ``translations.ungettext``, with the message
+    cached per plural index.
+    """
+    # Untranslated messages fall back to the English
+    # rule, hence ``num == 1`` in the key.
+    key = (singular, plural, translations.plural(num), num == 1)
+    try:
+        return translations._ngettext_cache[key]
+    except KeyError:
+        s = translations._ngettext_cache[key] = translations.ungettext(singular, plural, num)
+        return s
+
 class Domain(object):
     """Localization domain. By default will use look for tranlations in Flask
     botlication directory and "messages" domain - all message catalogs should
@@ -67,41 +199,92 @@ class Domain(object):
         self.translation_directories = translation_directories
         self.domain = domain
         self.cache = {}
+        self._by_locale_obj: Dict[Locale, support.Translations] = {}
+        self._last_locale: Locale = None
+        self._last_translations: support.Translations = None
+        self.template_cache = {}
         self.babel = _babel
     
-    def get_translations_cache(self) -> Dict[Tuple[str], support.Translations]:
+    def get_translations_cache(self) -> Dict[str, support.Translations]:
         """Returns dictionary-like object for translation caching"""
         return self.cache
     
-    def refresh(self) -> None:
+    def clear_cache(self) -> None:
         self.cache = {}
+        self._by_locale_obj = {}
+        self._last_locale = None
+        self._last_translations = None
+        self.template_cache = {}
+
+    def refresh(self) -> None:
+        self.clear_cache()
         for locale in self.babel.list_translations():
             self.get_translations(locale=locale)
     
+    async def async_refresh(self) -> None:
+        """|coro|
+
+        Same as :meth:`refresh`, but the locales are
+        loaded concurrently in the default executor.
+        """
+        self.clear_cache()
+        locales = self.babel.list_translations()
+        loop = asyncio.get_running_loop()
+        loaded = await asyncio.gather(*(
+            loop.run_in_executor(None, self.load_translations, locale)
+            for locale in locales
+        ))
+        # The cache is only written from the event loop,
+        # the executor threads just parse the catalogs.
+        for locale, translations in zip(locales, loaded):
+            self.cache[sys.intern(str(locale))] = translations
+    
     def get_translations(self, locale:Locale=None) -> support.Translations:
-        cache = self.get_translations_cache()
         if not locale:
             locale = self.babel.get_current_locale()
+        if locale is self._last_locale:
+            return self._last_translations
+        
+        translations = self._by_locale_obj.get(locale)
+        if translations is not None:
+            self._last_locale = locale
+            self._last_translations = translations
+            return translations
+        
+        cache = self.get_translations_cache()
+        # The domain is fixed for a Domain instance,
+        # the locale is enough to key the cache.
+        key = sys.intern(str(locale))
         try:
-            return cache[str(locale), domain]
+            translations = cache[key]
         except KeyError:
-            translations = support.Translations()
-
-            for dirname in self.translation_directories:
-                catalog = support.Translations.load(
-                    dirname,
-                    [locale],
-                    domain
-                )
-                translations.merge(catalog)
-                # FIXME: Workaround for merge() being really, really stupid. It
-                # does not copy _info, plural(), or any other instance variables
-                # populated by GNUTranslations. We probably want to stop using
-                # `support.Translations.merge` entirely.
-                if hasattr(catalog, 'plural'):
-                    translations.plural = catalog.plural
-            cache[str(locale), self.domain] = translations
-            return translations
+            translations = cache[key] = self.load_translations(locale)
+        
+        self._by_locale_obj[locale] = translations
+        self._last_locale = locale
+        self._last_translations = translations
+        return translations
+    
+    def load_translations(self, locale: Locale) -> support.Translations:
+        """Loads the translations of the locale from
+        the translation directories, without caching them.
+        """
+        translations = support.Translations(domain=self.domain)
+
+        # The catalogs are merged by hand: Translations.merge()
+        # does not copy _info or plural(), and Translations.load()
+        # wraps each file in an object we don't need.
+        for dirname in self.translation_directories:
+            catalog = _load_catalog(dirname, locale, self.domain)
+            if catalog is None:
+                continue
+            _intern_catalog(catalog)
+            translations._catalog.update(catalog._catalog)
+            translations.plural = catalog.plural
+            translations._info = catalog._info
+        translations._fast_cat = _flatten_catalog(translations)
+        translations._ngettext_cache = {}
+        return translations
     
     def gettext(self, string:str, locale: Locale=None, **variables):
         """Translates a string with the current locale and passes in the
@@ -112,10 +295,56 @@ class Domain(object):
             gettext(u'Hello World!')
             gettext(u'Hello %(name)s!', name='World')
         """
-        t = self.get_translations(locale=locale)
-        s = t.ugettext(string)
-        return s if not variables else s % variables
+        if not variables:
+            # Nothing to format, a catalog lookup
+            # is cheaper than the result cache.
+            return self.get_translations(locale=locale)._fast_cat.get(string, string)
+        if not locale:
+            locale = self.babel.get_current_locale()
+        return self._format(
+            variables,
+            lambda t: t._fast_cat.get(string, string),
+            locale=locale
+        )
     
+    def _format(self, variables, translate, locale: Locale=None) -> str:
+        """Returns the string translated with ``translate``
+        and formatted with ``variables``.
+
+        The formatted result is not cached: variables that
+        compare equal (``True`` and ``1.0``) or whose ``str()``
+        changes would return a wrong string.
+        """
+        t = self.get_translations(locale=locale)
+        s = translate(t)
+        # Strings without any format directive are returned as is,
+        # there is nothing to parse.
+        if variables and "%" in s:
+            # A variable used by the translation but not
+            # given keeps its placeholder instead of failing.
+            s = _to_format_string(s).format_map(_SafeDict(variables))
+        return s
+
+    def get_template(self, string:str, locale: Locale=None) -> str:
+        """Translates a format string with the current locale,
+        without formatting it. As format strings are constant,
+        their translations are cached per locale until the
+        domain is refreshed.
+
+        ::
+
+            get_template(u'Hello %(name)s!') % {'name': 'World'}
+        """
+        if not locale:
+            locale = self.babel.get_current_locale()
+        key = (string, locale)
+        try:
+            return self.template_cache[key]
+        except KeyError:
+            t = self.get_translations(locale=locale)
+            template = self.template_cache[key] = t._fast_cat.get(string, string)
+            return template
+
     async def discord_gettext(self, string:str, locale: Locale=None, **variables):
         """Translates a string with the current locale and passes in the
         given keyword arguments as mboting to a string formatting string.
@@ -125,9 +354,7 @@ class Domain(object):
             gettext(u'Hello World!')
             gettext(u'Hello %(name)s!', name='World')
         """
-        t = self.get_translations(locale=locale)
-        s = t.ugettext(string)
-        return s if not variables else s % variables
+        return self.gettext(string, locale=locale, **variables)
 
     def ngettext(self, singular:str, plural:str, num:int, **variables):
         """Translates a string with the current locale and passes in the
@@ -142,18 +369,24 @@ class Domain(object):
             ngettext(u'%(num)d botle', u'%(num)d botles', num=len(botles))
         """
         variables.setdefault('num', num)
-        t = self.get_translations()
-        s = t.ungettext(singular, plural, num)
-        return s if not variables else s % variables
+        locale = self.babel.get_current_locale()
+        return self._format(
+            variables,
+            lambda t: _plural_form(t, singular, plural, num),
+            locale=locale
+        )
 
     def pgettext(self, context, string:str, **variables):
         """Like :func:`gettext` but with a context.
 
         .. versionadded:: 0.7
         """
-        t = self.get_translations()
-        s = t.upgettext(context, string)
-        return s if not variables else s % variables
+        locale = self.babel.get_current_locale()
+        return self._format(
+            variables,
+            lambda t: t.upgettext(context, string),
+            locale=locale
+        )
 
     def npgettext(self, context, singular:str, plural:str, num:int, **variables):
         """Like :func:`ngettext` but with a context.
@@ -161,9 +394,12 @@ class Domain(object):
         .. versionadded:: 0.7
         """
         variables.setdefault('num', num)
-        t = self.get_translations()
-        s = t.unpgettext(context, singular, plural, num)
-        return s if not variables else s % variables
+        locale = self.babel.get_current_locale()
+        return self._format(
+            variables,
+            lambda t: t.unpgettext(context, singular, plural, num),
+            locale=locale
+        )
 
     def lazy_gettext(self, string:str, **variables):
         """Like :func:`gettext` but the string returned is lazy which means
@@ -204,6 +440,7 @@ class Domain(object):
 class Babel(object):
     def __init__(self, bot: Bot, default_locale: str="en") -> None:
         self.cache = {}
+        self._locales_cache: Optional[Tuple[Tuple[Optional[int]], List[Locale]]] = None
         self.bot = bot
         bot.babel = self
         self.domain = Domain(
@@ -215,6 +452,7 @@ class Babel(object):
         self.default_locale = Locale.parse(default_locale, sep="-")
 
         self._current_locale = contextvars.ContextVar("_current_locale", default=self.default_locale)
+        LazyString.cache_key = self.get_current_locale
 
         Babel.default_instance = self
     
@@ -242,9 +480,15 @@ class Babel(object):
         return self._current_locale.get()
 
     
-    @property
-    def translation_directories(self) -> Generator[str]:
-        directories = "translations"
+    @cached_property
+    def translation_directories(self) -> Tuple[str]:
+        return tuple(self._resolve_translation_directories())
+
+    def _resolve_translation_directories(self) -> Generator[str]:
+        directories = self.bot.config.get(
+            "BABEL_TRANSLATION_DIRECTORIES",
+            "translations"
+        ).split(";")
 
         for path in directories:
             if os.path.isabs(path):
@@ -258,33 +502,81 @@ class Babel(object):
         strings.
 
         .. versionadded:: 0.6
+
+        .. note::
+
+            The result is cached until the modification time
+            of one of the translation directories changes.
         """
+        mtimes = self._translation_directories_mtimes()
+        if self._locales_cache is not None and self._locales_cache[0] == mtimes:
+            return list(self._locales_cache[1])
+
         result = []
 
         for dirname in self.translation_directories:
             if not os.path.isdir(dirname):
                 continue
 
-            for folder in os.listdir(dirname):
-                locale_dir = os.path.join(dirname, folder, 'LC_MESSAGES')
-                if not os.path.isdir(locale_dir):
-                    continue
+            with os.scandir(dirname) as folders:
+                for folder in folders:
+                    locale_dir = os.path.join(folder.path, 'LC_MESSAGES')
+                    if not os.path.isdir(locale_dir):
+                        continue
 
-                if any(x.endswith('.mo') for x in os.listdir(locale_dir)):
-                    result.append(Locale.parse(folder))
+                    with os.scandir(locale_dir) as files:
+                        for file in files:
+                            if file.name.endswith('.mo'):
+                                result.append(_parse_locale(folder.name))
+                                break
 
         # If not other translations are found, add the default locale.
         if not result:
             result.append(Locale.parse(self.default_locale))
 
-        return result
+        self._locales_cache = (mtimes, result)
+        return list(result)
+    
+    def _translation_directories_mtimes(self) -> Tuple[Optional[int]]:
+        mtimes = []
+        for dirname in self.translation_directories:
+            try:
+                mtimes.append(os.stat(dirname).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _reset_translation_directories(self) -> None:
+        # Resolve the translation directories again,
+        # in case the config changed.
+        self.__dict__.pop("translation_directories", None)
+        self._locales_cache = None
+        self.domain.translation_directories = list(self.translation_directories)
 
     def refresh(self) -> None:
+        self._reset_translation_directories()
         self.domain.refresh()
 
     def load(self) -> None:
         return self.refresh()
     
+    async def async_refresh(self) -> None:
+        """|coro|
+
+        Same as :meth:`refresh`, but the locales
+        are loaded concurrently.
+        """
+        self._reset_translation_directories()
+        await self.domain.async_refresh()
+
+    async def async_load(self) -> None:
+        """|coro|
+
+        Same as :meth:`load`, but the locales
+        are loaded concurrently.
+        """
+        return await self.async_refresh()
+    
     def get_domain(self) -> Domain:
         return self.domain
 
@@ -313,6 +605,16 @@ async def discord_translator_gettext(string, locale: Locale = None, **variables)
     """
     return await get_domain().discord_gettext(string, locale=locale, **variables)
 
+def gettext_template(string):
+    """Translates a format string with the current locale,
+    without formatting it. The translation is cached.
+
+    ::
+
+        gettext_template(u'Hello %(name)s!') % {'name': 'World'}
+    """
+    return get_domain().get_template(string)
+
 _ = gettext
 
 def ngettext(singular, plural, num, **variables):
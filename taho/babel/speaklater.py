@@ -22,27 +22,52 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+_MISSING = object()
+
 class LazyString(object):
+    __slots__ = ("_func", "_args", "_kwargs", "_value", "_key")
+
+    # Callable returning the key the evaluated string depends on
+    # (the current locale). When it changes, the string is evaluated
+    # again, otherwise the cached value is used.
+    # Set by :class:`taho.babel.Babel`.
+    cache_key = None
+
     def __init__(self, func, *args, **kwargs):
         self._func = func
         self._args = args
         self._kwargs = kwargs
+        self._value = None
+        self._key = None
 
     def __getattr__(self, attr):
-        if attr == "__setstate__":
+        # Dunder probes (__setstate__, __deepcopy__, ...) are
+        # not forwarded, the supported ones are defined on the class.
+        if attr.startswith("__") and attr.endswith("__"):
             raise AttributeError(attr)
 
-        string = str(self)
-        if hasattr(string, attr):
-            return getattr(string, attr)
-
-        raise AttributeError(attr)
+        attr_obj = getattr(str(self), attr, _MISSING)
+        if attr_obj is _MISSING:
+            raise AttributeError(attr)
+        return attr_obj
 
     def __repr__(self):
         return "l'{0}'".format(str(self))
 
     def __str__(self):
-        return str(self._func(*self._args, **self._kwargs))
+        cache_key = LazyString.cache_key
+        key = cache_key() if cache_key is not None else None
+        value = self._value
+        if value is None or (key is not self._key and key != self._key):
+            value = self._value = str(self._func(*self._args, **self._kwargs))
+            self._key = key
+        return value
+
+    def invalidate(self) -> None:
+        """Forget the cached value, the string will be
+        evaluated again on next use.
+        """
+        self._value = None
 
     def __len__(self):
         return len(str(self))
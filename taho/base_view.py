@@ -23,8 +23,8 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from discord import ui
-from taho.babel import _
+from discord import ui, HTTPException
+from taho.babel import _, parse_discord_locale
 
 if TYPE_CHECKING:
     from discord.abc import Snowflake
@@ -46,28 +46,47 @@ class BaseView(ui.View):
         self.msg: Optional[Message] = None
         super().__init__(*args, **kwargs)
     
+    @property
+    def user(self) -> Optional[Snowflake]:
+        return self._user
+    
+    @user.setter
+    def user(self, user: Optional[Snowflake]) -> None:
+        self._user = user
+        # Only the ID is compared in interaction_check
+        self._user_id = user.id if user is not None else None
+    
     async def interaction_check(self, interaction: Interaction) -> bool:
-        if not self.user:
-            return True
-        allow = self.user.id == interaction.user.id
-
-        if not allow:
-            await interaction.response.send_message(
-                _("You are not allowed to use this view."),
-                ephemeral=True
+        # Resolve the locale once for the interaction, every
+        # translation made by the view's callbacks then uses it.
+        babel = getattr(interaction.client, "babel", None)
+        if babel is not None:
+            babel.set_current_locale(
+                parse_discord_locale(str(interaction.locale))
             )
 
-        return allow
+        if self._user_id is None or interaction.user.id == self._user_id:
+            return True
+
+        # Translated here (after the locale is set) and
+        # written in place so that pybabel extracts it.
+        await interaction.response.send_message(
+            _("You are not allowed to use this view."),
+            ephemeral=True
+        )
+        return False
     
     async def wait(self, delete_after: bool = False, edit_after: bool = False) -> bool:
         wait = await super().wait()
 
         if delete_after and self.msg:
+            # With a delay, discord.py deletes the message in a
+            # background task and ignores HTTP errors.
             await self.msg.delete(delay=0)
         elif edit_after and self.msg:
             try:
                 await self.msg.edit(view=None)
-            except:
+            except HTTPException:
                 pass #silent fail
         
         return wait
\ No newline at end of file
@@ -23,6 +23,7 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import asyncio
 from discord.ext import commands
 import discord
 from tortoise import Tortoise
@@ -33,12 +34,16 @@ from .babel import Babel
 from .lazy import lazy_convert
 import traceback
 
-import json
+try:
+    import orjson # installed with discord.py[speed]
+except ModuleNotFoundError:
+    orjson = None
+    import json
 
 
 if TYPE_CHECKING:
     from sshtunnel import SSHTunnelForwarder
-    from typing import Any, List
+    from typing import Any, FrozenSet
 
 __all__ = (
     "Bot",
@@ -46,9 +51,13 @@ __all__ = (
 
 def override_json() -> None:
 
-    def _to_json(obj: Any) -> str:
-        obj = lazy_convert(obj)
-        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+    if orjson is not None:
+        def _to_json(obj: Any) -> str:
+            return orjson.dumps(lazy_convert(obj)).decode('utf-8')
+    else:
+        def _to_json(obj: Any) -> str:
+            obj = lazy_convert(obj)
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
 
     discord.utils._to_json = _to_json
 
@@ -62,15 +71,29 @@ class Bot(commands.AutoShardedBot):
         super().__init__(command_prefix=commands.when_mentioned_or('!'), intents=intents, **kwargs)
         self.uptime = discord.utils.utcnow()
         self.config = vars(config)
+        self._use_ssh_tunnel = bool(self.config.get("USE_SSH_TUNNEL", False))
+        self._debug = bool(self.config.get("DEBUG", False))
+        self._test_guilds = tuple(self.config.get("TEST_GUILDS", []))
         self.sync_tree = sync_tree
         self.root_path = os.getcwd()
         self.ssh_server: SSHTunnelForwarder
-        self.registered_servers: List[int] = None
+        self.registered_servers: FrozenSet[int] = frozenset()
         self.babel: Babel = None
     
+    def add_registered_server(self, server_id: int) -> None:
+        """
+        Mark a server as registered in the database.
+
+        Parameters
+        -----------
+        server_id: :class:`int`
+            The server's ID.
+        """
+        self.registered_servers = self.registered_servers | {server_id}
+    
     def start_ssh_server(self):
         # The ssh server is only stared if wanted
-        if self.config.get("USE_SSH_TUNNEL", False):
+        if self._use_ssh_tunnel:
             self.ssh_server = init_ssh_tunnel(self.config)
             self.ssh_server.start()
         else:
@@ -78,7 +101,7 @@ class Bot(commands.AutoShardedBot):
         return True
     
     def stop_ssh_server(self):
-        if self.config.get("USE_SSH_TUNNEL", False):
+        if self._use_ssh_tunnel:
             self.ssh_server.stop()
         return True
 
@@ -88,6 +111,15 @@ class Bot(commands.AutoShardedBot):
         # to make it work with LazyString
         override_json()
 
+        # The SSH Tunnel will start only if configured.
+        # Starting it blocks until the tunnel is up, so it runs
+        # in a thread while the cogs are loaded.
+        ssh_start = asyncio.get_running_loop().run_in_executor(
+            None, self.start_ssh_server
+        )
+
+        # The cogs are loaded one by one, in the configured
+        # order, as a cog may depend on a previous one.
         for cog in self.config.get("cogs", []):
             print(f"Loading cog {cog}")
             try:
@@ -95,8 +127,7 @@ class Bot(commands.AutoShardedBot):
             except Exception as exc:
                 print(f'Could not load extension {cog} due to {exc.__class__.__name__}: {exc}')
         
-        # The SSH Tunnel will start only if configured
-        self.start_ssh_server()
+        await ssh_start
 
         # Database initialization
         await init_db(self.config, ssh_tunnel=self.ssh_server)
@@ -107,10 +138,15 @@ class Bot(commands.AutoShardedBot):
 
         
 
-        self.registered_servers = await db_models.Server.all().values_list("id", flat=True)
+        # Only the IDs are needed, read them straight from
+        # the rows instead of converting each one with the ORM
+        _, rows = await Tortoise.get_connection("default").execute_query(
+            f'SELECT "id" FROM "{db_models.Server._meta.db_table}"'
+        )
+        self.registered_servers = frozenset(row[0] for row in rows)
 
         babel = Babel(self)
-        babel.load()
+        await babel.async_load()
 
         register_bot(self)
         register_before_invoke(self)
@@ -119,18 +155,21 @@ class Bot(commands.AutoShardedBot):
 
             await self.tree.set_translator(TahoTranslator())
 
-            if self.config.get("DEBUG", False):
+            if self._debug:
                 print("DEBUG is enabled, syncing the tree to the test guilds...")
                 guilds = [
-                    discord.Object(guild_id) for guild_id in self.config.get("TEST_GUILDS", [])
+                    discord.Object(guild_id) for guild_id in self._test_guilds
                 ]
 
                 for guild in guilds:
-
                     self.tree.copy_global_to(guild=guild)
 
-                    await self.tree.sync(guild=guild)
+                # One REST call per guild, sent concurrently
+                await asyncio.gather(*(
+                    self.tree.sync(guild=guild) for guild in guilds
+                ))
 
+                for guild in guilds:
                     print(f"Synced the tree to {guild.id}")
                 
                 
@@ -144,8 +183,9 @@ class Bot(commands.AutoShardedBot):
             
 
     async def on_ready(self):
-        duration = (discord.utils.utcnow() - self.uptime).total_seconds()
-        self.uptime = discord.utils.utcnow()
+        now = discord.utils.utcnow()
+        duration = (now - self.uptime).total_seconds()
+        self.uptime = now
         print(f'Logged on as {self.user} (ID: {self.user.id}) in {len(self.guilds)} guilds and {duration} seconds')
 
     async def get_context(self, message, *, cls=None):
@@ -22,15 +22,18 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
+from functools import total_ordering
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Dict, Optional
     from taho.database.models import Currency
 
 __all__ = (
     "CurrencyAmount",
 )
 
+@total_ordering
 class CurrencyAmount:
     """
     Represents an amount of money in a specific currency.
@@ -62,9 +65,16 @@ class CurrencyAmount:
             Checks if the currency amount is greater than y's.
             If y is a float, it will be compared to :attr:`amount`.
         
+        .. describe:: x >= y
+
+            Checks if the currency amount is greater than or equal to y's.
+            If y is a float, it will be compared to :attr:`amount`.
+        
         .. describe:: hash(x)
 
             Returns the hash value for the currency amount.
+            As :attr:`amount` can change (see :meth:`credit`), 
+            don't credit an amount used as a dict key.
         
     Attributes
     -----------
@@ -76,39 +86,35 @@ class CurrencyAmount:
     __slots__ = (
         "amount",
         "currency",
+        "_conversions",
     )
 
     def __init__(self, amount: float, currency: Currency) -> None:
         self.amount = amount
         self.currency = currency
-        self._conversions = {}
+        self._conversions: Optional[Dict[int, float]] = None # created on first conversion
     
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, float):
+        if isinstance(other, (int, float)):
             return self.amount == other
-        return other.ammount == self.amount and other.currency == self.currency
-    
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
+        if isinstance(other, CurrencyAmount):
+            return self.amount == other.amount and self.currency == other.currency
+        return NotImplemented
     
     def __lt__(self, other: object) -> bool:
-        if isinstance(other, float):
+        if isinstance(other, (int, float)):
             return self.amount < other
-        return self.amount < other.amount
-    
-    def __le__(self, other: object) -> bool:
-        return self.__lt__(other) or self.__eq__(other)
-    
-    def __gt__(self, other: object) -> bool:
-        if isinstance(other, float):
-            return self.amount > other
-        return self.amount > other.amount
-    
-    def __ge__(self, other: object) -> bool:
-        return self.__gt__(other) or self.__eq__(other)
+        if isinstance(other, CurrencyAmount):
+            return self.amount < other.amount
+        return NotImplemented
     
     def __hash__(self) -> int:
-        return hash((self.amount, self.currency.__repr__()))
+        # Hash the currency's ID rather than its repr,
+        # unsaved currencies have no ID yet.
+        currency_id = getattr(self.currency, "id", None)
+        if currency_id is None:
+            currency_id = id(self.currency)
+        return hash((self.amount, currency_id))
     
     async def convert(self, currency: Currency) -> float:
         """|coro|
@@ -128,14 +134,19 @@ class CurrencyAmount:
         """
         if currency == self.currency: # no conversion needed
             return self.amount
-        if not hasattr(self, "_conversions"):
-            self._conversions = {} # prevent case where this class is parent of
-            # the CurrencyAmount model (in which self.__init__ is not called)
-        if currency not in self._conversions: # no conversion yet
+        # getattr: this class is parent of the CurrencyAmount
+        # model, in which self.__init__ is not called
+        conversions = getattr(self, "_conversions", None)
+        if conversions is None:
+            conversions = self._conversions = {}
+        # the conversions are keyed by the currency's ID,
+        # hashing an int is cheaper than hashing a model
+        currency_id = currency.id
+        if currency_id not in conversions: # no conversion yet
             # convert from the current currency to the given currency
             # and store the result in the conversions dict
-            self._conversions[currency] = await self.currency.convert(currency, self.amount)
-        return self._conversions[currency] # return the converted amount
+            conversions[currency_id] = await self.currency.convert(currency, self.amount)
+        return conversions[currency_id] # return the converted amount
     
     async def credit(self, amount: float) -> None:
         """
@@ -167,7 +178,10 @@ class CurrencyAmount:
         """
         amount = self.amount if not opposite else -self.amount
         new = CurrencyAmount(amount, self.currency)
-        if opposite:
-            for currency, amount in self._conversions.items():
-                new._conversions[currency] = -amount
+        conversions = getattr(self, "_conversions", None)
+        if opposite and conversions:
+            new._conversions = {
+                currency_id: -amount
+                for currency_id, amount in conversions.items()
+            }
         return new
\ No newline at end of file
@@ -33,7 +33,17 @@ __all__ = (
     "get_type",
 )
 
-def convert_to_type(value: str, type: InfoType) -> Union[None, bool, int, float, str]:
+# Keyed by the raw int values, so the ``type`` stored
+# in JSON can be used without building the enum.
+_converters = {
+    InfoType.NULL.value: lambda value: None,
+    InfoType.BOOL.value: bool,
+    InfoType.INT.value: int,
+    InfoType.STR.value: str,
+    InfoType.FLOAT.value: float,
+}
+
+def convert_to_type(value: str, type: Union[InfoType, int]) -> Union[None, bool, int, float, str]:
     """
     Convert a value from the DB to a certain type.
 
@@ -41,8 +51,8 @@ def convert_to_type(value: str, type: InfoType) -> Union[None, bool, int, float,
     -----------
     value: :class:`str`
         The value to convert.
-    type: :class:`~taho.enums.InfoType`
-        The type to convert to.
+    type: Union[:class:`~taho.enums.InfoType`, :class:`int`]
+        The type to convert to, or its value.
     
     Raises
     -------
@@ -54,15 +64,18 @@ def convert_to_type(value: str, type: InfoType) -> Union[None, bool, int, float,
     Union[None, bool, int, float, str]
         The converted value.
     """
-    if type == InfoType.NULL:
-        return None
-    converters = {
-        InfoType.BOOL: bool,
-        InfoType.INT: int,
-        InfoType.STR: str,
-        InfoType.FLOAT: float
-    }
-    return converters[type](value)
+    try:
+        converter = _converters[type]
+    except KeyError:
+        raise ValueError(f"{type!r} is not a valid InfoType")
+    return converter(value)
+
+_types = {
+    bool: InfoType.BOOL,
+    int: InfoType.INT,
+    str: InfoType.STR,
+    float: InfoType.FLOAT
+}
 
 def get_type(value: Union[None, bool, int, float, str]) -> InfoType:
     """
@@ -87,10 +100,4 @@ def get_type(value: Union[None, bool, int, float, str]) -> InfoType:
     """
     if value is None:
         return InfoType.NULL
-    types = {
-        bool: InfoType.BOOL,
-        int: InfoType.INT,
-        str: InfoType.STR,
-        float: InfoType.FLOAT
-    }
-    return types.get(type(value), InfoType.other)
\ No newline at end of file
+    return _types.get(type(value), InfoType.other)
\ No newline at end of file
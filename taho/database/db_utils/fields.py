@@ -22,6 +22,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -32,6 +33,9 @@ __all__ = (
     "get_link_field",
 )
 
+_FK_TYPES = frozenset(("ForeignKeyField", "ForeignKeyFieldInstance"))
+
+@lru_cache(maxsize=None)
 def get_link_field(model: Type[BaseModel]) -> Optional[str]:
     """
     Get the "link field" of a DB model,
@@ -47,13 +51,17 @@ def get_link_field(model: Type[BaseModel]) -> Optional[str]:
     --------
     Optional[:class:`str`]
         The link field, if exists.
+
+
+    .. note::
+
+        The link field of a model never changes,
+        so the result is cached for each model.
     """
-    link_field = [
-        f["name"] for f in model.get_fields() 
-        if f["field_type"] in ("ForeignKeyField", "ForeignKeyFieldInstance") \
-            and not "shortcut" in f["name"]
-    ]
-    if link_field:
-        return link_field[0]
-    else:
-        return None
\ No newline at end of file
+    return next(
+        (
+            f["name"] for f in model.get_fields() 
+            if f["field_type"] in _FK_TYPES and "shortcut" not in f["name"]
+        ),
+        None
+    )
\ No newline at end of file
@@ -121,7 +121,7 @@ async def new_server(bot: Bot, guild: discord.Guild, *fetch_related: List[str])
     if fetch_related:
         await server.fetch_related(*fetch_related)
     
-    bot.registered_servers.append(guild.id)
+    bot.add_registered_server(guild.id)
 
     return server
 
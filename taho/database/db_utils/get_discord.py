@@ -22,23 +22,34 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
+import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from taho import Bot
-    from typing import Optional
+    from typing import Optional, Dict, Iterable, List, Tuple
     import discord
 
 __all__ = (
     "get_discord_guild",
     "get_discord_role",
-    "get_discord_member"
+    "get_discord_member",
+    "get_discord_bulk",
 )
 
+# One lock per guild being chunked, so concurrent
+# callers wait for a single chunk request.
+_chunk_locks: Dict[int, asyncio.Lock] = {}
+
 async def get_discord_guild(bot: Bot, guild_id: int) -> Optional[discord.Guild]:
     guild = bot.get_guild(guild_id)
     if guild and not guild.chunked:
-        await guild.chunk()
+        lock = _chunk_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            if not guild.chunked:
+                await guild.chunk()
+        if guild.chunked:
+            _chunk_locks.pop(guild_id, None)
     return guild
 
 async def get_discord_role(bot: Bot, guild_id: int, role_id: int) -> Optional[discord.Role]:
@@ -51,4 +62,19 @@ async def get_discord_member(bot: Bot, guild_id: int, user_id: int) -> Optional[
     guild = await get_discord_guild(bot, guild_id)
     if not guild:
         return None
-    return guild.get_member(user_id)
\ No newline at end of file
+    return guild.get_member(user_id)
+
+async def get_discord_bulk(
+    bot: Bot, 
+    guild_id: int, 
+    *,
+    role_ids: Iterable[int] = (), 
+    user_ids: Iterable[int] = ()
+    ) -> Tuple[List[Optional[discord.Role]], List[Optional[discord.Member]]]:
+    guild = await get_discord_guild(bot, guild_id)
+    if not guild:
+        return [None for _ in role_ids], [None for _ in user_ids]
+    return (
+        [guild.get_role(role_id) for role_id in role_ids],
+        [guild.get_member(user_id) for user_id in user_ids]
+    )
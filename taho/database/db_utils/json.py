@@ -23,81 +23,169 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import re
-from tortoise import exceptions as t_exceptions
+from collections import defaultdict
+from functools import lru_cache
+import asyncio
+import logging
 from taho.exceptions import BadFormat, DoesNotExist
 from taho.enums import InfoType
+from .converter import convert_to_type
 import json
 
+_log = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from ..models import BaseModel
-    from typing import TypeVar, Tuple
+    from typing import TypeVar, Tuple, List, Optional, Type, Iterable
 
     T = TypeVar("T")
     U = TypeVar("U")
 
 __all__ = (
     "value_from_json",
+    "values_from_json",
     "value_to_json",
 )
 
 converters = {}
+_BaseModel = None
+
+_OTHER_TYPE = InfoType.other.value
 
-async def _get_converters() -> None:
-    global converters
+def _get_converters() -> None:
+    global converters, _BaseModel
     if converters:
         return
     else:
-        from .. import models
-        converters = dict([(name, cls) for name, cls in models.__dict__.items() if isinstance(cls, type)])
+        from .. import models # avoid circular import
+        _BaseModel = models.BaseModel
+        converters = {
+            name: cls for name, cls in vars(models).items() 
+            if isinstance(cls, type)
+        }
 
-async def _value_from_json(value: T, fetch: bool = True, silent_error: bool = False) -> U:
-    await _get_converters()
+def _parse_ref(value: str) -> Optional[Tuple[Type[BaseModel], int]]:
+    """Returns the (converter, pk) stored in a ``Model(pk)``
+    string, or ``None`` if the string isn't one.
+    """
+    # Most strings are rejected here, so that
+    # they don't fill the cache.
+    if len(value) < 4 or value[-1] != ")":
+        return None
+    return _resolve_ref(value)
 
-    if isinstance(value, (list, tuple)):
-        value = [await _value_from_json(v, fetch=False) for v in value]
-        if not fetch:
-            return value
-        else:
-            converter_map = {}
-            for v in value:
-                if not v[0] in converter_map:
-                    converter_map[v[0]] = []
-                converter_map[v[0]].append(v[1])
-            
-            new_value = []
-            for converter, values in converter_map.items():
-                new_value.extend(await converter.filter(pk__in=values))
-
-            new_value = {
-                (v.__class__, v.pk): v for v in new_value
-            }
-            
-            return [
-                new_value[v] for v in value
-            ]
-    elif not isinstance(value, str):
-        return value
-    else:
-        regex = r"([A-Za-z]+)\(([0-9]+)+\)"
-        match = re.findall(regex, value)
-        if not match:
-            return value
-        else:
-            match = match[0]
-            converter = converters.get(match[0], None)
-            if not converter:
-                return value
-            elif fetch:
-                try:
-                    return await converter.get(pk=match[1])
-                except t_exceptions.DoesNotExist:
-                    if silent_error:
-                        return None
-                    else:
-                        raise DoesNotExist(f"The {converter.__class__.__name__} with the id {match[1]} does not exists.")
+@lru_cache(maxsize=256)
+def _resolve_ref(value: str) -> Optional[Tuple[Type[BaseModel], int]]:
+    # Parsed by hand, the format is simple enough.
+    # The same references come back often (the
+    # same objects are stored in many values), the
+    # result is cached. The converters are always
+    # loaded before this is called.
+    index = value.find("(")
+    if index < 1:
+        return None
+    converter = converters.get(value[:index], None)
+    if not converter:
+        return None
+    pk = value[index+1:-1]
+    if not pk.isdecimal():
+        return None
+    return converter, int(pk)
+
+def _collect(value: T, refs: Optional[List[Tuple[list, int, Type[BaseModel], int]]]) -> List[U]:
+    """Returns a one-item list holding a copy of the value
+    where every ``Model(pk)`` string is replaced by a 
+    (converter, pk) tuple.
+    If ``refs`` is not ``None``, the position of each tuple
+    is appended to it, to be replaced later.
+    """
+    # The value is walked with an explicit stack,
+    # whatever its nesting.
+    root = [value]
+    stack = [(root, 0, value)]
+    while stack:
+        holder, index, v = stack.pop()
+        if isinstance(v, (list, tuple)):
+            new = holder[index] = list(v)
+            stack.extend((new, i, child) for i, child in enumerate(new))
+        elif isinstance(v, str):
+            ref = _parse_ref(v)
+            if ref is not None:
+                holder[index] = ref
+                if refs is not None:
+                    refs.append((holder, index, ref[0], ref[1]))
+    return root
+
+async def _fetch_refs(refs: List[Tuple[list, int, Type[BaseModel], int]], silent_error: bool) -> None:
+    """Fetches the DB objects referenced in ``refs``
+    and puts them in place.
+    """
+    # One query per model, whatever the
+    # number of objects and the nesting.
+    groups = defaultdict(set)
+    for _, _, converter, pk in refs:
+        groups[converter].add(pk)
+    
+    # The queries are independent, they are run concurrently.
+    results = await asyncio.gather(*[
+        converter.filter(pk__in=pks) for converter, pks in groups.items()
+    ])
+    table = {
+        converter: {obj.pk: obj for obj in objs}
+        for converter, objs in zip(groups, results)
+    }
+    
+    for holder, index, converter, pk in refs:
+        try:
+            holder[index] = table[converter][pk]
+        except KeyError:
+            if silent_error:
+                _log.warning(
+                    "The %s with the id %s does not exist, it is replaced by None.",
+                    converter.__name__, pk
+                )
+                holder[index] = None
             else:
-                return converter, int(match[1])
+                raise DoesNotExist(f"The {converter.__name__} with the id {pk} does not exists.")
+
+def _value_from_json_sync(value: T) -> U:
+    """Returns the value with the DB objects as 
+    (converter, pk) tuples, without fetching them.
+    No query is done, so no coroutine is needed.
+    """
+    _get_converters()
+    return _collect(value, None)[0]
+
+async def _value_from_json(value: T, silent_error: bool = False) -> U:
+    _get_converters()
+
+    # First pass: walk the whole value and collect
+    # the DB objects it references, at any depth.
+    refs = []
+    root = _collect(value, refs)
+    
+    # Second pass: fetch the objects and put them in place.
+    if refs:
+        await _fetch_refs(refs, silent_error)
+    return root[0]
+
+def _decode(json_value: T) -> Tuple[U, int]:
+    """Returns the value and the type of a JSON value."""
+    # An already decoded dict (e.g. from a JSONField)
+    # is used as is.
+    if isinstance(json_value, (str, bytes, bytearray)):
+        try:
+            json_value = json.loads(json_value)
+        except ValueError: # JSONDecodeError, UnicodeDecodeError
+            raise BadFormat("See the function's docs.")
+    try:
+        value = json_value["value"]
+    except (KeyError, TypeError):
+        raise BadFormat("See the function's docs.")
+    
+    # The raw int from the JSON is used as is,
+    # the enum is never built.
+    return value, json_value.get("type", _OTHER_TYPE)
 
 async def value_from_json(json_value: T, fetch: bool = True, silent_error: bool = False) -> U:
     """|coro|
@@ -114,8 +202,9 @@ async def value_from_json(json_value: T, fetch: bool = True, silent_error: bool
 
     Parameters
     -----------
-    value:
-        The value to convert.
+    value: Union[:class:`str`, :class:`bytes`, :class:`dict`]
+        The value to convert, as a JSON string
+        or already decoded.
     fetch: :class:`bool`
         Whether to fetch from the Database (queries) the values.
         If ``False``, it will return the value under this format:
@@ -124,7 +213,7 @@ async def value_from_json(json_value: T, fetch: bool = True, silent_error: bool
     silent_error: :class:`bool`
         Whether to raise an error if an object does not exists
         in the DB. If ``True``, an unknown object will be returned
-        as ``None``.
+        as ``None`` and a warning is logged.
         Default to ``False``.
     
     Raises
@@ -155,40 +244,88 @@ async def value_from_json(json_value: T, fetch: bool = True, silent_error: bool
         ...
 
     """
-    if isinstance(json_value, str):
-        try:
-            json_value = json.loads(json_value)
-        except json.decoder.JSONDecodeError:
-            raise BadFormat("See the function's docs.")
-    try:
-        value = json_value["value"]
-    except IndexError:
-        raise BadFormat("See the function's docs.")
-    
-    type = json_value.get("type", InfoType.other.value)
-    type = InfoType(type)
-    if type == InfoType.other:
-        return await _value_from_json(value, fetch=fetch, silent_error=silent_error)
-    else:
-        from .converter import convert_to_type
+    value, type = _decode(json_value)
+    if type != _OTHER_TYPE:
         return convert_to_type(value, type)
+    elif fetch:
+        return await _value_from_json(value, silent_error=silent_error)
+    else:
+        return _value_from_json_sync(value)
 
-def _value_to_json(value: T) -> Tuple[str, InfoType]:
+async def values_from_json(json_values: Iterable[T], fetch: bool = True, silent_error: bool = False) -> List[U]:
+    """|coro|
+
+    Same as :func:`value_from_json`, for many values at 
+    once: the DB objects referenced by all the values 
+    are fetched together, with one query per model.
+
+    Parameters
+    -----------
+    json_values:
+        The values to convert.
+    fetch: :class:`bool`
+        Whether to fetch from the Database (queries) the values.
+        Default to ``True``.
+    silent_error: :class:`bool`
+        Whether to raise an error if an object does not exists
+        in the DB. If ``True``, an unknown object will be returned
+        as ``None`` and a warning is logged.
+        Default to ``False``.
+    
+    Raises
+    -------
+    ~taho.exceptions.DoesNotExist
+        A value does not exist in the DB.
+        Not raised if ``silent_error`` is ``True``.
+    
+    Returns
+    --------
+    List
+        The values, in the same order.
+    """
+    _get_converters()
+
+    refs = [] if fetch else None
+    roots = []
+    for json_value in json_values:
+        value, type = _decode(json_value)
+        if type == _OTHER_TYPE:
+            roots.append(_collect(value, refs))
+        else:
+            roots.append([convert_to_type(value, type)])
+    
+    if refs:
+        await _fetch_refs(refs, silent_error)
+    return [root[0] for root in roots]
+
+# Exact types, so that a bool is not taken for an int.
+_SCALAR_TYPES = {
+    type(None): InfoType.NULL,
+    bool: InfoType.BOOL,
+    int: InfoType.INT,
+    float: InfoType.FLOAT,
+    str: InfoType.STR,
+}
+
+def _inner_to_json(value: T) -> U:
+    # Only the value is needed for the items
+    # of a list, their type is not stored.
+    if type(value) in _SCALAR_TYPES:
+        return value
     if isinstance(value, (list, tuple)):
-        value = [_value_to_json(v)[0] for v in value]
-        type = InfoType.other
+        return [_inner_to_json(v) for v in value]
+    if isinstance(value, _BaseModel):
+        return f"{value.__class__.__name__}({value.pk})"
+    return value
 
-    else:
-        from .converter import get_type
-        from taho.database.models import BaseModel
-        type = get_type(value)
-        if type == InfoType.other:
-            if isinstance(value, BaseModel):
-                value = f"{value.__class__.__name__}({value.pk})"
-        
-    return value, type
+def _value_to_json(value: T) -> Tuple[str, InfoType]:
+    type_ = _SCALAR_TYPES.get(type(value))
+    if type_ is not None:
+        return value, type_
+    return _inner_to_json(value), InfoType.other
 
 def value_to_json(value: T) -> str:
+    _get_converters()
     value, type = _value_to_json(value)
     return json.dumps({
             "value": value,
@@ -105,16 +105,16 @@ async def get_shortcut(model: BaseModel, field_name: str) -> Shortcutable:
     id_name = field_name + "_id"
     short_name = field_name.replace("_shortcut", "")
     field_value_name = "_" + short_name
-    if hasattr(model, id_name) and hasattr(model, field_value_name):
-        shortcut = getattr(model, field_value_name)
-        if isinstance(shortcut, Shortcutable):
-            return shortcut
-        else:
-            shortcut = await shortcut.get()
-            setattr(model, field_value_name, shortcut)
-            return shortcut
-    elif hasattr(model, id_name) and not hasattr(model, field_value_name):
+    if not hasattr(model, id_name):
+        return None
+
+    shortcut = getattr(model, field_value_name, None)
+    # The Shortcutable is already cached.
+    if isinstance(shortcut, Shortcutable):
+        return shortcut
+
+    if shortcut is None:
         shortcut: Shortcut = await getattr(model, field_name)
-        shortcut = await shortcut.get()
-        setattr(model, field_value_name, shortcut)
-        return shortcut
\ No newline at end of file
+    shortcut = await shortcut.get()
+    setattr(model, field_value_name, shortcut)
+    return shortcut
\ No newline at end of file
@@ -22,9 +22,16 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
+from typing import TYPE_CHECKING
 from .base import BaseModel
+from .shortcut import AccessRuleShortcut
 from tortoise import fields
-from taho.abstract import AbstractAccessRule
+from tortoise.queryset import QuerySet
+from taho.abc import Shortcutable
+
+if TYPE_CHECKING:
+    from typing import Iterable, List, Union
+    from taho.abstract import AbstractAccessRule
 
 
 __all__ = (
@@ -100,12 +107,87 @@ class AccessRule(BaseModel):
 
         Returns the access rule as an abstract access rule.
 
+        This fetches the rule's entity if it isn't cached,
+        use :meth:`to_abstract_many` for many rules.
+
         Returns
         --------
         :class:`~taho.utils.AbstractAccessRule`
             The abstract access rule.
         """
+        from taho.abstract import AbstractAccessRule # avoid circular import
+
         return AbstractAccessRule(
             have_access=self.have_access,
             access=await self.access
         )
+    
+    @classmethod
+    async def to_abstract_many(cls, rules: Union[Iterable[AccessRule], QuerySet[AccessRule]]) -> List[AbstractAccessRule]:
+        """|coro|
+
+        Returns many access rules as abstract access rules,
+        with one query for the shortcuts and one query per 
+        type of entity, instead of two queries per rule.
+
+        The shortcuts already loaded (e.g. with
+        ``.prefetch_related("access_shortcut")``) and the
+        entities already cached are not fetched again.
+        If a queryset is given, its shortcuts are 
+        prefetched with the rules.
+
+        Prefer this to :meth:`to_abstract` when converting
+        more than one rule.
+
+        Parameters
+        -----------
+        rules: Union[Iterable[:class:`.AccessRule`], :class:`tortoise.queryset.QuerySet`]
+            The access rules to convert.
+
+        Returns
+        --------
+        List[:class:`~taho.utils.AbstractAccessRule`]
+            The abstract access rules, in the same order.
+        """
+        from taho.abstract import AbstractAccessRule # avoid circular import
+
+        if isinstance(rules, QuerySet):
+            rules = await rules.prefetch_related("access_shortcut")
+        rules = list(rules)
+
+        # The entity is cached under "_access" once 
+        # fetched (see get_shortcut).
+        accesses = [
+            access if isinstance(access, Shortcutable) else None
+            for access in (getattr(rule, "_access", None) for rule in rules)
+        ]
+
+        to_fetch = {
+            rule.access_shortcut_id 
+            for rule, access in zip(rules, accesses)
+            if access is None and not hasattr(rule, "_access_shortcut")
+        }
+        if to_fetch:
+            shortcuts = {
+                shortcut.pk: shortcut
+                for shortcut in await AccessRuleShortcut.filter(pk__in=to_fetch)
+            }
+            for rule in rules:
+                if rule.access_shortcut_id in shortcuts:
+                    rule.access_shortcut = shortcuts[rule.access_shortcut_id]
+        
+        abstract_rules = [
+            AbstractAccessRule(
+                have_access=rule.have_access,
+                access=access,
+                access_shortcut=None if access is not None else rule._access_shortcut,
+            )
+            for rule, access in zip(rules, accesses)
+        ]
+        await AbstractAccessRule.prefetch_many(abstract_rules)
+
+        for rule, abstract_rule in zip(rules, abstract_rules):
+            rule._access = abstract_rule.access
+            # Same output as to_abstract.
+            abstract_rule.access_shortcut = None
+        return abstract_rules
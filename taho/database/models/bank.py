@@ -25,9 +25,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, overload
 import uuid
 import tortoise
+from decimal import Decimal
 from .base import BaseModel
 from tortoise import fields
-from tortoise.signals import post_save
+from tortoise.expressions import F
+from tortoise.signals import post_save, post_delete
+from tortoise.transactions import in_transaction
 from taho.exceptions import AlreadyExists, DoesNotExist, QuantityException
 from taho.enums import ShortcutType
 from taho.database import db_utils
@@ -35,6 +38,7 @@ from taho.abc import OwnerShortcutable
 from .info import Info
 from .access_rule import AccessRule
 import asyncio
+import time
 
 import sys
 
@@ -53,6 +57,20 @@ __all__ = (
     "BankingTransaction",
 )
 
+# The infos of a bank are read often and rarely change,
+# their raw JSON values are cached (never the ORM objects
+# they may reference).
+# {bank_id: {key: (expires_at, json_value)}}
+_infos_cache: Dict[int, Dict[str, Tuple[float, Optional[Dict[str, Any]]]]] = {}
+_INFOS_CACHE_TTL = 60
+
+def clear_bank_cache() -> None:
+    """Clears the cached infos of every bank.
+
+    Must be called when the database is reset.
+    """
+    _infos_cache.clear()
+
 class Bank(BaseModel):
     """Represents a bank.
 
@@ -222,12 +240,8 @@ class Bank(BaseModel):
             "description": self.description,
             "default_currency_id": self.default_currency_id,
             "default_currency": await self.default_currency if self.default_currency_id else None,
-            "infos": [
-                await info.to_abstract() async for info in self.infos.all()
-            ],
-            "access_rules": [
-                await rule.to_abstract() async for rule in self.access_rules.all()
-            ],
+            "infos": await BankInfo.to_abstract_many(await self.infos.all()),
+            "access_rules": await BankAccessRule.to_abstract_many(self.access_rules.all()),
         }
 
         if to_edit:
@@ -261,16 +275,52 @@ class Bank(BaseModel):
         ------
         KeyError
             If the info does not exist.
+        ~taho.exceptions.DoesNotExist
+            If the info references an object that
+            does not exist anymore.
         
         Returns
         --------
         Union[:class:`str`, :class:`int`, :class:`float`, :class:`None`, :class:`bool`]
             The info.
         """
-        async for info in self.infos:
-            if info.key == key:
-                return info.value
-        return None
+        now = time.monotonic()
+        bank_infos = _infos_cache.setdefault(self.pk, {})
+        cached = bank_infos.get(key)
+        if cached is not None and cached[0] > now:
+            json_value = cached[1]
+        else:
+            info = await BankInfo.get_or_none(bank_id=self.pk, key=key)
+            json_value = info.value if info else None
+            bank_infos[key] = (now + _INFOS_CACHE_TTL, json_value)
+
+        if json_value is None:
+            raise KeyError(f"No info with key {key}")
+        return await db_utils.value_from_json(json_value)
+
+    async def set_info(self, key: str, value: Any) -> None:
+        """|coro|
+
+        Sets the value of a key in the bank's infos.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key to set the value of.
+        value: Any
+            The value to set.
+            If :class:`None`, the info will be deleted.
+        """
+        if value is None:
+            await BankInfo.filter(bank_id=self.pk, key=key).delete()
+        else:
+            await BankInfo.update_or_create(
+                bank_id=self.pk,
+                key=key,
+                defaults={"value": db_utils.value_to_json(value)}
+            )
+        # The infos may be deleted in bulk, without signal.
+        _infos_cache.pop(self.pk, None)
 
     async def get_account(self, account_id: Optional[int]=None) -> BankAccount:
         """|coro|
@@ -297,7 +347,7 @@ class Bank(BaseModel):
         if account_id is None:
             return await self._get_default_account(force_get=True)
         try:
-            return await BankAccount.get(bank=self, pk=account_id)
+            return await BankAccount.get(pk=account_id, bank_id=self.pk)
         except tortoise.exceptions.DoesNotExist:
             raise DoesNotExist("Account not found.")
 
@@ -316,11 +366,19 @@ class Bank(BaseModel):
             The orderings used must by a field of the BankingTransaction model.
 
         """
-        return (
-            await BankingTransaction.filter(account__bank__pk=self.pk)
+        # The related objects are loaded in the same query.
+        # The bank of the accounts is this one, it is set
+        # without joining (and building the join of) the 
+        # banks table.
+        transactions = (
+            await BankingTransaction.filter(account__bank_id=self.pk)
+            .select_related("account", "currency")
             .order_by(*orderings)
             .limit(limit or sys.maxsize)
         )
+        for transaction in transactions:
+            transaction.account.bank = self
+        return transactions
         
     async def create_account(self, owner: OwnerShortcutable, currency: Currency=None) -> BankAccount:
         """|coro|
@@ -354,6 +412,9 @@ class Bank(BaseModel):
         This account is purely indicative, it is useful to make
         the balance bewteen charges and interests.
 
+        The default account is the account of the bank
+        without owner.
+
         .. warning::
             Use force_create only if you know what you are doing.
             You have to check if the account already exists.
@@ -365,17 +426,15 @@ class Bank(BaseModel):
         :class:`.BankAccount`
             The default account.
         """
-        # if not default_user:
-        default_user = await db_utils.get_default_user(self.cluster_id)
         default_currency = await db_utils.get_default_currency(self.cluster_id)
         
         return await BankAccount.create(
             bank=self, 
-            owner=default_user,
+            owner_shortcut=None,
             currency=default_currency,
             )
     
-    async def _get_default_account(self, default_user: User=None, force_get: bool=False) -> BankAccount:
+    async def _get_default_account(self, force_get: bool=False) -> BankAccount:
         """|coro|
 
         Get the default account for the bank.
@@ -384,9 +443,6 @@ class Bank(BaseModel):
 
         Parameters
         ----------
-        default_user: Optional[:class:`~taho.database.User`]
-            The cluster's default user, the default_account is 
-            created with this user.
         force_get: :class:`bool`
             If True, the default account is created if it does not exist
             rather than raising an error.
@@ -402,15 +458,13 @@ class Bank(BaseModel):
         :class:`.BankAccount`
             The default account.
         """
-        try:
-            if not default_user:
-                default_user = await (await self.cluster).get_default_user()
-            
-            return await BankAccount.get(bank=self, default_user=default_user)
-        except tortoise.exceptions.DoesNotExist:
-            if force_get:
-                return await self._create_default_account(default_user=default_user)
-            raise DoesNotExist("Default account does not exist.")
+        # The default account is the one without owner.
+        account = await BankAccount.get_or_none(bank_id=self.pk, owner_shortcut_id=None)
+        if account is not None:
+            return account
+        if force_get:
+            return await self._create_default_account()
+        raise DoesNotExist("Default account does not exist.")
     
     async def edit(self, **options) -> None:
         """|coro|
@@ -451,6 +505,8 @@ class Bank(BaseModel):
 
         await self.save()
         await asyncio.gather(*queries)
+        # The infos are deleted in bulk, without signal.
+        _infos_cache.pop(self.pk, None)
 
     async def have_access(self, entity: Union[User, Role]) -> bool:
         access_rules = await self.access_rules.all().values_list("access_shortcut__role_id", "have_access")
@@ -576,9 +632,34 @@ class BankInfo(Info):
     """
     class Meta:
         table = "bank_infos"
+        indexes = (("bank", "key"),)
 
     bank = fields.ForeignKeyField("main.Bank", related_name="infos")
 
+@post_save(BankInfo)
+async def bank_info_post_save(_, instance: BankInfo, *args, **kwargs) -> None:
+    """|coro|
+
+    Clears the cached infos of the bank when one of them is saved.
+
+    .. warning::
+
+        This function is used as a signal, it's not meant to be called manually.
+    """
+    _infos_cache.pop(instance.bank_id, None)
+
+@post_delete(BankInfo)
+async def bank_info_post_delete(_, instance: BankInfo, *args, **kwargs) -> None:
+    """|coro|
+
+    Clears the cached infos of the bank when one of them is deleted.
+
+    .. warning::
+
+        This function is used as a signal, it's not meant to be called manually.
+    """
+    _infos_cache.pop(instance.bank_id, None)
+
 class BankAccessRule(AccessRule):
     """Represents an access rule to a bank.
 
@@ -660,7 +741,7 @@ async def create_transaction_operation(
     currency: Currency = ...,
     description: str = ...,
     return_transactions: bool = ...,
-) -> Optional[Tuple[BankingTransaction]]:
+) -> Optional[Tuple[BankingTransaction, BankingTransaction]]:
     ...
 
 @overload
@@ -670,7 +751,7 @@ async def create_transaction_operation(
     amount: CurrencyAmount,
     description: str = ...,
     return_transactions: bool = ...,
-) -> Optional[Tuple[BankingTransaction]]:
+) -> Optional[Tuple[BankingTransaction, BankingTransaction]]:
     ...
 
 async def create_transaction_operation(
@@ -681,7 +762,7 @@ async def create_transaction_operation(
     amount: Optional[CurrencyAmount] = None, 
     description: Optional[str] = None,
     return_transactions: bool = False
-    ) -> Optional[Tuple[BankingTransaction]]:
+    ) -> Optional[Tuple[BankingTransaction, BankingTransaction]]:
     """|coro|
 
     Create a transaction operation between two accounts.
@@ -709,8 +790,8 @@ async def create_transaction_operation(
         If True, the transactions are returned.
 
         .. note::
-            Returning the transactions is less optimized because two queries are
-            performed.
+            Returning the transactions costs one more query, 
+            to get them back from the DB with their IDs.
 
     Raises
     ------
@@ -722,8 +803,8 @@ async def create_transaction_operation(
 
     Returns
     -------
-    Optional[Tuple[:class:`.BankingTransaction`]]
-        The transactions created.
+    Optional[Tuple[:class:`.BankingTransaction`, :class:`.BankingTransaction`]]
+        The transactions created (the debit, then the credit).
         If the ``return_transactions`` parameter is ``False``, 
         then ``None`` is returned.
     
@@ -762,12 +843,17 @@ async def create_transaction_operation(
             ref=ref
         )
     )
+    # Both transactions are inserted in one query.
+    await BankingTransaction.bulk_create(transactions)
     if return_transactions:
-        await transactions[0].save()
-        await transactions[1].save()
-        return transactions
-    else:
-        await BankingTransaction.bulk_create(transactions)
+        # bulk_create doesn't set the IDs, the transactions are
+        # read back in one query, by their shared ref (debit first).
+        debit, credit = (
+            await BankingTransaction.filter(ref=ref)
+            .select_related("account", "currency")
+            .order_by("amount", "id")
+        )
+        return debit, credit
 
 class BankAccount(BaseModel):
     """
@@ -858,6 +944,7 @@ class BankAccount(BaseModel):
     """
     class Meta:
         table = "bank_accounts"
+        indexes = (("bank", "owner_shortcut"),)
 
     id = fields.IntField(pk=True)
 
@@ -942,8 +1029,10 @@ class BankAccount(BaseModel):
             currencies.
             Please use :meth:`.BankAccount.credit` instead.
         """
-        self.balance += amount
-        await self.save()
+        # The balance is updated in the DB, not overwritten,
+        # so that concurrent operations are not lost.
+        await BankAccount.filter(pk=self.pk).update(balance=F("balance") + amount)
+        self.balance = Decimal(self.balance) + Decimal(str(amount))
     
     @overload
     async def _convert(
@@ -1092,26 +1181,38 @@ class BankAccount(BaseModel):
                 "The amount to transfer is greater than the account's balance."
             )
 
-        # Debit the account with the converted_amount
-        await self._credit(-converted_amount)
-
-        # Use the parameters of the transfer to credit the other account
-        # This way, an additional conversion is not needed
-        await to.credit(
-            money=money,
-            currency=currency,
-            amount=amount,
-        )
-
-        await create_transaction_operation(
-            self, 
-            to, 
-            money=money,
-            currency=currency,
-            amount=amount,
-            description=description
+        # The debit, the credit and the transactions
+        # are done together or not at all.
+        async with in_transaction():
+            # Debit the account with the converted_amount,
+            # only if the balance in the DB is still enough.
+            debited = await BankAccount.filter(
+                pk=self.pk, 
+                balance__gte=converted_amount
+            ).update(balance=F("balance") - converted_amount)
+            if not debited:
+                raise QuantityException(
+                    "The amount to transfer is greater than the account's balance."
+                )
+            self.balance = Decimal(self.balance) - Decimal(str(converted_amount))
+
+            # Use the parameters of the transfer to credit the other account
+            # This way, an additional conversion is not needed
+            await to.credit(
+                money=money,
+                currency=currency,
+                amount=amount,
             )
 
+            await create_transaction_operation(
+                self, 
+                to, 
+                money=money,
+                currency=currency,
+                amount=amount,
+                description=description
+                )
+
     
 
 
@@ -1174,6 +1275,7 @@ class BankingTransaction(BaseModel):
             Tortoise: :class:`tortoise.models.fields.UUIDField`
 
                 - :attr:`null` True
+                - :attr:`index` True
 
             Python: Optional[:class:`uuid.UUID`]
         
@@ -1226,7 +1328,7 @@ class BankingTransaction(BaseModel):
     account: BankAccount = fields.ForeignKeyField("main.BankAccount", related_name="transactions")
     amount = fields.DecimalField(max_digits=32, decimal_places=2)
     currency = fields.ForeignKeyField("main.Currency")
-    ref = fields.UUIDField(null=True)
+    ref = fields.UUIDField(null=True, index=True)
     date = fields.DatetimeField(auto_now_add=True)
     description = fields.CharField(max_length=255, null=True)
 
@@ -1242,4 +1344,8 @@ class BankingTransaction(BaseModel):
             The similar transactions.
         """
         #todo check return type
-        return await BankingTransaction.filter(ref=self.ref).all().exclude(id=self.id)
\ No newline at end of file
+        # A transaction without ref is alone, the
+        # other transactions without ref are not similar.
+        if self.ref is None:
+            return []
+        return await BankingTransaction.filter(ref=self.ref).exclude(id=self.id)
\ No newline at end of file
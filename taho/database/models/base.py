@@ -31,7 +31,7 @@ from taho.emoji import Emoji
 import asyncio
 
 if TYPE_CHECKING:
-    from typing import Optional, Iterable, List, Any, Type, TypeVar
+    from typing import Optional, Iterable, List, Any, Type, TypeVar, Dict
     from tortoise import BaseDBAsyncClient
 
     MODEL = TypeVar('MODEL', bound="BaseModel")
@@ -47,6 +47,10 @@ else:
         "BaseModel",
     )
 
+# The fields of a model never change once Tortoise is
+# initialized, so they are only described once per model.
+_fields_cache: Dict[Type[BaseModel], List[dict]] = {}
+
 # This class is used to avoid reusing the same coroutine
 # multiple times (which results in a RuntimeError).
 class _Shortcut:
@@ -68,8 +72,12 @@ class BaseModel(Model):
     
     @classmethod
     def get_fields(cls) -> List[dict]:
+        try:
+            return _fields_cache[cls]
+        except KeyError:
+            pass
         desc = cls.describe(serializable=True)
-        return [
+        fields = _fields_cache[cls] = [
             field
             for field in chain(
                 desc.get("data_fields", []),
@@ -77,6 +85,7 @@ class BaseModel(Model):
                 desc.get("o2o_fields", []),
             )
         ]
+        return fields
     
     def __eq__(self, other: object) -> bool:
         return super().__eq__(other)
@@ -25,9 +25,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from .base import BaseModel
 from tortoise import fields
-from taho.abstract import AbstractClassStat
 
 if TYPE_CHECKING:
+    from taho.abstract import AbstractClassStat
     from typing import Optional
     from .cluster import Cluster
     from .role import Role
@@ -218,6 +218,8 @@ class ClassStat(BaseModel):
         :class:`~taho.utils.AbstractClassStat`
             The abstract stat.
         """
+        from taho.abstract import AbstractClassStat # avoid circular import
+
         return AbstractClassStat(
             stat=await self.stat,
             value=self.value
@@ -240,9 +240,7 @@ class Craft(BaseModel):
             "description": self.description,
             "time": self.time,
             "per": self.per,
-            "access_rules": [
-                await rule.to_abstract() async for rule in self.access_rules.all()
-            ],
+            "access_rules": await CraftAccessRule.to_abstract_many(self.access_rules.all()),
             "reward_packs": [
                 await pack.to_abstract() async for pack in self.reward_packs.all()
             ],
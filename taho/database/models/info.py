@@ -25,11 +25,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from .base import BaseModel
 from tortoise import fields
-from taho.abstract import AbstractInfo
-from ..db_utils import value_from_json
+from ..db_utils import value_from_json, values_from_json
 
 if TYPE_CHECKING:
-    from typing import TypeVar
+    from taho.abstract import AbstractInfo
+    from typing import TypeVar, Iterable, List, Any
 
     T = TypeVar("T", None, bool, int, float, str)
 
@@ -117,6 +117,13 @@ class Info(BaseModel):
     key = fields.CharField(max_length=255)
     value = fields.JSONField()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Changing the value invalidates
+        # its cached python value.
+        if name == "value":
+            self.__dict__.pop("_py_value", None)
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
             return self.value == other.value
@@ -139,7 +146,46 @@ class Info(BaseModel):
         :class:`~taho.utils.AbstractInfo`
             The abstract info.
         """
+        from taho.abstract import AbstractInfo # avoid circular import
+
         return AbstractInfo(
             key=self.key,
             value=await self.get_py_value()
         )
+    
+    @classmethod
+    async def to_abstract_many(cls, infos: Iterable[Info]) -> List[AbstractInfo]:
+        """|coro|
+
+        Returns many infos as abstract infos, the DB objects
+        stored in their values are fetched together.
+
+        Parameters
+        -----------
+        infos: Iterable[:class:`.Info`]
+            The infos to convert.
+
+        Returns
+        --------
+        List[:class:`~taho.utils.AbstractInfo`]
+            The abstract infos, in the same order.
+        """
+        from taho.abstract import AbstractInfo # avoid circular import
+
+        infos = list(infos)
+        to_convert = [info for info in infos if not hasattr(info, "_py_value")]
+        py_values = await values_from_json(
+            [info.value for info in to_convert], 
+            fetch=True, 
+            silent_error=True
+        )
+        for info, py_value in zip(to_convert, py_values):
+            info._py_value = py_value
+
+        return [
+            AbstractInfo(
+                key=info.key,
+                value=info._py_value
+            )
+            for info in infos
+        ]
@@ -353,9 +353,7 @@ class Item(BaseModel, StuffShortcutable):
             "cooldown": self.cooldown,
             "currency_id": self.currency_id,
             "currency": await self.currency if self.currency_id else None,
-            "access_rules": [
-                await rule.to_abstract() async for rule in self.access_rules.all()
-            ],
+            "access_rules": await ItemAccessRule.to_abstract_many(self.access_rules.all()),
             "reward_packs": [
                 await pack.to_abstract() async for pack in self.reward_packs.all()
             ],
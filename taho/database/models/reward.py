@@ -27,10 +27,10 @@ from .base import BaseModel
 from tortoise import fields
 from tortoise.validators import MinValueValidator, MaxValueValidator
 from taho.enums import RewardType
-from taho.abstract import AbstractReward, AbstractRewardPack
 
 
 if TYPE_CHECKING:
+    from taho.abstract import AbstractReward, AbstractRewardPack
     from typing import Union, Tuple
     from taho.abc import StuffShortcutable
 
@@ -123,6 +123,8 @@ class RewardPack(BaseModel):
         :class:`~taho.utils.AbstractRewardPack`
             The abstract reward pack.
         """
+        from taho.abstract import AbstractRewardPack # avoid circular import
+
         return AbstractRewardPack(
             type=self.type,
             luck=self.luck,
@@ -278,6 +280,8 @@ class Reward(BaseModel):
         :class:`~taho.utils.AbstractReward`
             The abstract reward.
         """
+        from taho.abstract import AbstractReward # avoid circular import
+
         return AbstractReward(
             stuff=await self.stuff,
             regeneration=self.regeneration,
@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from tortoise import Tortoise
 from typing import TYPE_CHECKING
+from .models.bank import clear_bank_cache
 
 if TYPE_CHECKING:
     from sshtunnel import SSHTunnelForwarder
@@ -50,7 +51,12 @@ _models = [
     "taho.database.models.user",
     ]
 
-async def init_db(config: dict, ssh_tunnel: SSHTunnelForwarder=None, _create_db: bool=False) -> None:
+async def init_db(
+    config: dict, 
+    ssh_tunnel: SSHTunnelForwarder=None, 
+    reset: bool=False,
+    _create_db: bool=False
+    ) -> None:
     """|coro|
 
     Connect and initialize the database.
@@ -62,6 +68,15 @@ async def init_db(config: dict, ssh_tunnel: SSHTunnelForwarder=None, _create_db:
         the config file.
     tunnel: Optional[:class:`sshtunnel.SSHTunnelForwarder`]
         The SSH tunnel instance if used.
+    reset: Optional[bool]
+        Whether to drop every table of the schema
+        and create them again, the cached values
+        of the models are cleared too.
+        Defaults to ``False``.
+
+        .. warning::
+
+            This deletes all the data of the schema.
     _create_db: Optional[bool]
         Whether to create the database.
         Only for testing purposes.
@@ -91,5 +106,21 @@ async def init_db(config: dict, ssh_tunnel: SSHTunnelForwarder=None, _create_db:
         _create_db=_create_db
     )
 
-    if _create_db:
+    if reset:
+        conn = Tortoise.get_connection("default")
+        # Drop every table of the schema server-side,
+        # in one round trip, whatever the models are.
+        await conn.execute_script("""
+        DO $$
+        DECLARE r record;
+        BEGIN
+            FOR r IN SELECT tablename FROM pg_tables WHERE schemaname = current_schema() LOOP
+                EXECUTE 'DROP TABLE IF EXISTS ' || quote_ident(r.tablename) || ' CASCADE';
+            END LOOP;
+        END $$;
+        """)
+        # The cached values belong to the dropped tables.
+        clear_bank_cache()
+
+    if _create_db or reset:
         await Tortoise.generate_schemas()
\ No newline at end of file
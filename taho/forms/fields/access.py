@@ -85,6 +85,7 @@ class AccessRuleView(FieldView):
                 _("**No rules have been set yet.**"),
             ]
         else:
+            await AbstractAccessRule.prefetch_many(self.value)
             rule_list = [
                 await rule.get_display(guild_id=guild_id)
                 for rule in self.value
@@ -373,6 +374,8 @@ class AccessRuleViewRemove(_BaseAccessRuleView):
     async def get_content(self) -> str:
         content = [_("Select the rules you want to remove in the list below.\n\n")]
 
+        await AbstractAccessRule.prefetch_many(self.rules)
+
         for rule in self.rules:
             rule_display = await rule.get_display(guild_id=self.guild_id)
 
@@ -512,6 +515,7 @@ class AccessRule(Field):
             self.display_value = _("*Unanswered*")
         else:
             guild_id = self.form.guild.id
+            await AbstractAccessRule.prefetch_many(self.value)
             self.display_value = "\n".join([
                 await rule.get_display(guild_id=guild_id) 
                 for rule in self.value
@@ -24,10 +24,11 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from discord.ext import commands
-from babel import Locale
+from taho.babel import parse_discord_locale
 from taho.database import db_utils
 
 if TYPE_CHECKING:
+    from babel import Locale
     from taho.database.models import (
         User,
         Cluster,
@@ -49,8 +50,8 @@ class TahoContext(commands.Context):
     
     async def babel_locale(self) -> Locale:
         if self.interaction:
-            return Locale.parse(str(self.interaction.locale), sep="-")
-        return Locale.parse(self.guild.preferred_locale.value, sep="-")
+            return parse_discord_locale(str(self.interaction.locale))
+        return parse_discord_locale(self.guild.preferred_locale.value)
     
     async def get_cluster(self) -> Cluster:
         """|coro|
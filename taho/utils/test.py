@@ -197,7 +197,7 @@ async def setup_db_test(bot: Bot) -> List[str]:
     ]
 
     for g in guilds:
-        bot.registered_servers.append(g.id)
+        bot.add_registered_server(g.id)
 
     users: List[User] = [
         await User.create(cluster=clusters[0], user_id=members[0]),
@@ -13,6 +13,7 @@ TEST_GUILDS = [] # Enter guild ids here
 BABEL_DOMAIN = "messages"
 BABEL_DEFAULT_LOCALE = "en"
 BABEL_DEFAULT_TIMEZONE = "UTC"
+BABEL_TRANSLATION_DIRECTORIES = "translations" # Separated by ";"
 
 # The DB has to be hosted by PostgreSQL
 DB_USERNAME = ""
@@ -0,0 +1,113 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present Taho-DiscordBot
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+import types
+import pytest
+from babel import Locale
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo
+from taho.babel import Babel, gettext, ngettext, pgettext, npgettext, gettext_template
+
+@pytest.fixture
+def babel(tmp_path):
+    catalog = Catalog(locale="fr")
+    catalog.add("Hello %(name)s", "Bonjour %(name)s")
+    catalog.add(("%(num)d apple", "%(num)d apples"), ("%(num)d pomme", "%(num)d pommes"))
+    catalog.add("%(name)s is here", "%(name)s est là (%(place)s)")
+    catalog.add("May", "Mai", context="month")
+    catalog.add(("%(num)d day", "%(num)d days"), ("%(num)d jour", "%(num)d jours"), context="duration")
+    directory = tmp_path / "fr" / "LC_MESSAGES"
+    directory.mkdir(parents=True)
+    with open(directory / "messages.mo", "wb") as f:
+        write_mo(f, catalog)
+
+    bot = types.SimpleNamespace(
+        root_path=str(tmp_path), 
+        config={"BABEL_TRANSLATION_DIRECTORIES": str(tmp_path)}
+    )
+    babel = Babel(bot)
+    babel.load()
+    return babel
+
+def test_gettext_equal_variables(babel):
+    # True == 1 == 1.0, each one must be formatted
+    # with its own str().
+    assert gettext("Value: %(v)s", v=1) == "Value: 1"
+    assert gettext("Value: %(v)s", v=True) == "Value: True"
+    assert gettext("Value: %(v)s", v=1.0) == "Value: 1.0"
+
+def test_gettext_changing_str(babel):
+    class Named:
+        name = "a"
+        def __str__(self) -> str:
+            return self.name
+    
+    obj = Named()
+    assert gettext("Name: %(obj)s", obj=obj) == "Name: a"
+    obj.name = "b"
+    assert gettext("Name: %(obj)s", obj=obj) == "Name: b"
+
+def test_gettext_missing_variable(babel):
+    assert gettext("%(a)s and %(b)s", a="x") == "x and %(b)s"
+
+def test_gettext_locale(babel):
+    assert gettext("Hello %(name)s", name="Taho") == "Hello Taho"
+    babel.set_current_locale(Locale.parse("fr"))
+    assert gettext("Hello %(name)s", name="Taho") == "Bonjour Taho"
+    assert gettext_template("Hello %(name)s") == "Bonjour %(name)s"
+
+def test_ngettext(babel):
+    assert ngettext("%(num)d apple", "%(num)d apples", 1) == "1 apple"
+    assert ngettext("%(num)d apple", "%(num)d apples", 2) == "2 apples"
+    babel.set_current_locale(Locale.parse("fr"))
+    assert ngettext("%(num)d apple", "%(num)d apples", 1) == "1 pomme"
+    assert ngettext("%(num)d apple", "%(num)d apples", 3) == "3 pommes"
+
+def test_ngettext_plural_rules(babel):
+    # 0 is plural in english but singular in french.
+    assert ngettext("%(num)d apple", "%(num)d apples", 0) == "0 apples"
+    babel.set_current_locale(Locale.parse("fr"))
+    assert ngettext("%(num)d apple", "%(num)d apples", 0) == "0 pomme"
+    assert ngettext("%(num)d apple", "%(num)d apples", 1) == "1 pomme"
+
+def test_format_translation(babel):
+    assert gettext("100%") == "100%"
+    assert gettext("%(name)s is here", name="Taho") == "Taho is here"
+    babel.set_current_locale(Locale.parse("fr"))
+    # The translation uses a variable that is not given.
+    assert gettext("%(name)s is here", name="Taho") == "Taho est là (%(place)s)"
+
+def test_pgettext(babel):
+    assert pgettext("month", "May") == "May"
+    assert npgettext("duration", "%(num)d day", "%(num)d days", 2) == "2 days"
+    babel.set_current_locale(Locale.parse("fr"))
+    assert pgettext("month", "May") == "Mai"
+    assert gettext("May") == "May"
+    assert npgettext("duration", "%(num)d day", "%(num)d days", 1) == "1 jour"
+    assert npgettext("duration", "%(num)d day", "%(num)d days", 2) == "2 jours"
+
+def test_format_conversions(babel):
+    assert gettext("{%(a)s}", a=1) == "{1}"
+    assert gettext("%(luck)s %%", luck=5) == "5 %"
+    assert gettext("%(x)05.1f|%(y)-4s|%(z)r|%(n)+d", x=3.14159, y="ab", z="q", n=4) == "003.1|ab  |'q'|+4"
+    assert gettext("%(num)d left", other=1) == "%(num)s left"
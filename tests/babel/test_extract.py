@@ -0,0 +1,38 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present Taho-DiscordBot
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+import os
+from babel.messages.extract import DEFAULT_KEYWORDS, extract_from_file
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+def _extract(path: str):
+    return [
+        message[1] for message in
+        extract_from_file("python", os.path.join(_ROOT, path), keywords=DEFAULT_KEYWORDS)
+    ]
+
+def test_extract_base_view():
+    # The deny message must stay visible to pybabel,
+    # otherwise update_babel removes its translations.
+    assert "You are not allowed to use this view." in _extract("taho/base_view.py")
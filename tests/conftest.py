@@ -62,33 +62,10 @@ async def connect_db(request):
         ssh_tunnel = None
     pytest.ssh_tunnel = ssh_tunnel
 
-    await init_db(config, ssh_tunnel=ssh_tunnel)
-
-    conn = Tortoise.get_connection('default')
-    await conn.execute_script("""
-    DROP TABLE IF EXISTS guild_clusters CASCADE;
-    DROP TABLE IF EXISTS guilds CASCADE;
-    DROP TABLE IF EXISTS users CASCADE;
-    DROP TABLE IF EXISTS banks CASCADE;
-    DROP TABLE IF EXISTS guild_infos CASCADE;
-    DROP TABLE IF EXISTS cluster_infos CASCADE;
-    DROP TABLE IF EXISTS bank_accounts CASCADE;
-    DROP TABLE IF EXISTS bank_operations CASCADE;
-    DROP TABLE IF EXISTS bank_infos CASCADE;
-    DROP TABLE IF EXISTS items CASCADE;
-    DROP TABLE IF EXISTS inventories CASCADE;
-    DROP TABLE IF EXISTS roles CASCADE;
-    DROP TABLE IF EXISTS stats CASCADE;
-    DROP TABLE IF EXISTS item_roles CASCADE;
-    DROP TABLE IF EXISTS item_stats CASCADE;
-    DROP TABLE IF EXISTS jobs CASCADE;
-    DROP TABLE IF EXISTS job_rewards CASCADE;
-    DROP TABLE IF EXISTS npcs CASCADE;
-    DROP TABLE IF EXISTS npc_roles CASCADE;
-    DROP TABLE IF EXISTS npc_owners CASCADE;
-    """)
-
-    await Tortoise.generate_schemas()
+    # Every test starts from an empty schema, as with the
+    # DROP TABLE list this fixture ran before: the test DB
+    # must not hold anything else.
+    await init_db(config, ssh_tunnel=ssh_tunnel, reset=True)
 
     request.addfinalizer(close_db)
 
@@ -0,0 +1,43 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present Taho-DiscordBot
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+import pytest
+from taho.abstract import AbstractAccessRule
+from taho.database.models import *
+from taho.enums import ShortcutableType
+from .fixture import db_data
+
+@pytest.mark.asyncio
+async def test_prefetch_many_dangling_shortcut(db_data):
+    user = db_data.users[0]
+    shortcut = await AccessRuleShortcut.create(type=ShortcutableType.user, user=user)
+    # A shortcut whose entity does not exist anymore.
+    dangling = await AccessRuleShortcut.create(type=ShortcutableType.role, role=None)
+    rules = [
+        AbstractAccessRule(have_access=True, access_shortcut=shortcut),
+        AbstractAccessRule(have_access=False, access_shortcut=dangling),
+    ]
+
+    await AbstractAccessRule.prefetch_many(rules)
+    assert rules[0].access == user
+    assert rules[1].access is None
@@ -0,0 +1,128 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present Taho-DiscordBot
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+import pytest
+from taho.abstract import AbstractInfo
+from taho.database import init_db
+from taho.database.models import *
+from taho.database.models.bank import _infos_cache, create_transaction_operation
+from taho.exceptions import DoesNotExist, QuantityException
+from .fixture import db_data
+
+@pytest.mark.asyncio
+async def test_bank_transfer(db_data):
+    cluster: Cluster = db_data.clusters[0]
+    currency = await Currency.create(cluster=cluster, name="Transfer Currency")
+    bank = await cluster.create_bank(name="Transfer Bank", default_currency=currency)
+    account1 = await BankAccount.create(bank=bank, currency=currency, balance=10, owner=db_data.users[0])
+    account2 = await BankAccount.create(bank=bank, currency=currency, owner=db_data.users[1])
+    # The same account, loaded before the first transfer.
+    stale_account1 = await BankAccount.get(pk=account1.pk)
+
+    await account1.transfer(account2, money=8, description="test")
+    assert account1.balance == 2
+    assert account2.balance == 8
+    assert (await BankAccount.get(pk=account1.pk)).balance == 2
+    assert (await BankAccount.get(pk=account2.pk)).balance == 8
+    transactions = await BankingTransaction.filter(account_id__in=(account1.pk, account2.pk))
+    assert sorted(t.amount for t in transactions) == [-8, 8]
+    assert len({t.ref for t in transactions}) == 1
+
+    # The balance is checked in the DB, so a stale
+    # balance does not allow to transfer more.
+    with pytest.raises(QuantityException):
+        await stale_account1.transfer(account2, money=8)
+    with pytest.raises(QuantityException):
+        await account1.transfer(account2, money=3)
+    assert (await BankAccount.get(pk=account1.pk)).balance == 2
+    assert (await BankAccount.get(pk=account2.pk)).balance == 8
+    assert await BankingTransaction.filter(account_id__in=(account1.pk, account2.pk)).count() == 2
+
+@pytest.mark.asyncio
+async def test_bank_info_cache(db_data):
+    cluster: Cluster = db_data.clusters[0]
+    bank = await cluster.create_bank(
+        name="Bank Info Cache",
+        default_currency=None,
+        infos=[AbstractInfo("test1", "test")]
+    )
+    assert await bank.get_info("test1") == "test"
+    with pytest.raises(KeyError):
+        await bank.get_info("test2")
+    # Only the raw JSON values are cached.
+    assert set(_infos_cache[bank.pk]) == {"test1", "test2"}
+    assert _infos_cache[bank.pk]["test2"][1] is None
+    assert isinstance(_infos_cache[bank.pk]["test1"][1], (str, dict))
+
+    # Saving an info invalidates the cache of its bank.
+    info = await BankInfo.get(bank=bank, key="test1")
+    info.value = AbstractInfo("test1", "test2").to_db_payload()["value"]
+    await info.save()
+    assert bank.pk not in _infos_cache
+    assert await bank.get_info("test1") == "test2"
+
+    # So does setting or deleting an info.
+    await bank.set_info("test2", [cluster])
+    assert bank.pk not in _infos_cache
+    assert await bank.get_info("test2") == [cluster]
+    await bank.set_info("test2", None)
+    with pytest.raises(KeyError):
+        await bank.get_info("test2")
+
+    # A reference to a missing object is not silenced.
+    await bank.set_info("test3", ["Cluster(0)"])
+    with pytest.raises(DoesNotExist):
+        await bank.get_info("test3")
+
+    # Resetting the DB clears the cache.
+    await init_db(pytest.bot.config, ssh_tunnel=pytest.ssh_tunnel, reset=True)
+    assert not _infos_cache
+
+@pytest.mark.asyncio
+async def test_bank_default_account(db_data):
+    cluster: Cluster = db_data.clusters[1]
+    currency = await Currency.create(cluster=cluster, name="Default Currency", is_default=True)
+    bank = await cluster.create_bank(name="Default Bank", default_currency=currency)
+    account = await bank.get_account()
+    assert account.owner_shortcut_id is None
+    assert (await bank.get_account()).pk == account.pk
+    assert await BankAccount.filter(bank=bank).count() == 1
+
+@pytest.mark.asyncio
+async def test_bank_transaction_operation(db_data):
+    cluster: Cluster = db_data.clusters[0]
+    currency = await Currency.create(cluster=cluster, name="Operation Currency")
+    bank = await cluster.create_bank(name="Operation Bank", default_currency=currency)
+    account1 = await BankAccount.create(bank=bank, currency=currency, owner=db_data.users[0])
+    account2 = await BankAccount.create(bank=bank, currency=currency, owner=db_data.users[1])
+
+    debit, credit = await create_transaction_operation(
+        account1, account2, money=5, return_transactions=True
+    )
+    assert debit.pk and credit.pk
+    assert (debit.account.pk, debit.amount) == (account1.pk, -5)
+    assert (credit.account.pk, credit.amount) == (account2.pk, 5)
+    assert debit.ref == credit.ref
+
+    assert await create_transaction_operation(account1, account2, money=2) is None
+    assert await BankingTransaction.filter(account__bank_id=bank.pk).count() == 4
@@ -0,0 +1,85 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present Taho-DiscordBot
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+import math
+import pytest
+from taho.database.db_utils import value_to_json, value_from_json, values_from_json
+from taho.database.models import *
+from taho.exceptions import BadFormat, DoesNotExist
+from .fixture import db_data
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [
+    None, True, 0, 3, 3.14, "test", "Cluster (1)",
+    2**70, -2**70, [1, [2, ["a", None]]],
+])
+async def test_json_round_trip(value):
+    assert await value_from_json(value_to_json(value)) == value
+
+@pytest.mark.asyncio
+async def test_json_non_str_keys():
+    # Keys are converted to str, as JSON does.
+    assert await value_from_json(value_to_json({1: "a"})) == {"1": "a"}
+
+@pytest.mark.asyncio
+async def test_json_nan():
+    assert math.isnan(await value_from_json(value_to_json(float("nan"))))
+    value = await value_from_json(value_to_json([float("nan")]))
+    assert len(value) == 1 and math.isnan(value[0])
+
+@pytest.mark.asyncio
+async def test_json_decode():
+    assert await value_from_json(b'{"value": 3, "type": 2}') == 3
+    assert await value_from_json({"value": "a", "type": 4}) == "a"
+    assert await value_from_json('{"value": [["a"], "b"], "type": 5}', fetch=False) == [["a"], "b"]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["{}", "[1]", "not json", b"\xff"])
+async def test_json_bad_format(value):
+    with pytest.raises(BadFormat):
+        await value_from_json(value)
+
+@pytest.mark.asyncio
+async def test_json_nested_models(db_data):
+    clusters = db_data.clusters
+    users = db_data.users
+    value = [clusters[0], [users[0], [clusters[1], "a"]], users[0]]
+    assert await value_from_json(value_to_json(value)) == value
+    assert await value_from_json(value_to_json(value), fetch=False) == [
+        (Cluster, clusters[0].pk),
+        [(User, users[0].pk), [(Cluster, clusters[1].pk), "a"]],
+        (User, users[0].pk),
+    ]
+    assert await values_from_json([
+        value_to_json(clusters[0]),
+        value_to_json([[users[1]]]),
+        value_to_json(3),
+    ]) == [clusters[0], [[users[1]]], 3]
+
+@pytest.mark.asyncio
+async def test_json_nested_missing_model(db_data, caplog):
+    json_value = value_to_json([["a", "Cluster(0)"]])
+    assert await value_from_json(json_value, silent_error=True) == [["a", None]]
+    assert "The Cluster with the id 0 does not exist" in caplog.text
+    with pytest.raises(DoesNotExist):
+        await value_from_json(json_value)
@@ -0,0 +1,79 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present Taho-DiscordBot
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from types import SimpleNamespace
+import pytest
+from taho.currency_amount import CurrencyAmount
+
+class FakeCurrency(SimpleNamespace):
+    async def convert(self, currency, amount):
+        self.conversions += 1
+        return amount * currency.rate / self.rate
+
+def currency(id, rate=1):
+    return FakeCurrency(id=id, rate=rate, conversions=0)
+
+def test_currency_amount_comparison():
+    euro, dollar = currency(1), currency(2)
+    assert CurrencyAmount(3, euro) == 3
+    assert CurrencyAmount(3, euro) == 3.0
+    assert CurrencyAmount(3, euro) == CurrencyAmount(3, euro)
+    assert CurrencyAmount(3, euro) != CurrencyAmount(3, dollar)
+    assert CurrencyAmount(3, euro) != "3"
+    assert CurrencyAmount(2, euro) < 3
+    assert CurrencyAmount(2, euro) <= CurrencyAmount(2, euro)
+    assert CurrencyAmount(4, euro) > CurrencyAmount(3, dollar)
+    assert CurrencyAmount(4, euro) >= 4
+    assert sorted([CurrencyAmount(2, euro), CurrencyAmount(1, euro)]) == [
+        CurrencyAmount(1, euro), CurrencyAmount(2, euro)
+    ]
+
+def test_currency_amount_hash():
+    euro = currency(1)
+    assert hash(CurrencyAmount(3, euro)) == hash(CurrencyAmount(3, currency(1)))
+    assert len({CurrencyAmount(3, euro), CurrencyAmount(3, euro)}) == 1
+    # An unsaved currency has no ID.
+    assert hash(CurrencyAmount(3, currency(None)))
+
+@pytest.mark.asyncio
+async def test_currency_amount_convert():
+    euro, dollar = currency(1), currency(2, rate=2)
+    amount = CurrencyAmount(3, euro)
+    assert await amount.convert(euro) == 3
+    assert await amount.convert(dollar) == 6
+    # The conversions are cached by currency ID.
+    assert await amount.convert(currency(2, rate=2)) == 6
+    assert euro.conversions == 1
+
+@pytest.mark.asyncio
+async def test_currency_amount_clone():
+    euro, dollar = currency(1), currency(2, rate=2)
+    amount = CurrencyAmount(3, euro)
+    assert amount.clone(opposite=True) == -3
+
+    await amount.convert(dollar)
+    clone = amount.clone(opposite=True)
+    assert clone == CurrencyAmount(-3, euro)
+    assert await clone.convert(dollar) == -6
+    assert euro.conversions == 1
+    assert amount.clone() == amount